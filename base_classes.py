@@ -5,18 +5,22 @@ Fecha: 2025-06-22
 Descripción: Clases base para tareas, scheduler de tareas y gestión de hilos
 """
 
+import os
+import sys
 import threading
 import time
-import queue
 import uuid
+import heapq
+import itertools
 from abc import ABC, abstractmethod
+from collections import deque, OrderedDict
 from datetime import datetime, timedelta
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Dict, List, Any, Optional, Callable, Union
 from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from concurrent.futures import CancelledError, TimeoutError as FutureTimeoutError
 import logging
-import traceback
 
 from config_and_imports import SystemConfig, SystemConstants
 from utilities import (
@@ -37,14 +41,25 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
     PAUSED = "paused"
 
-class TaskPriority(Enum):
+class TaskPriority(IntEnum):
     """Prioridades de las tareas"""
     LOW = 1
     NORMAL = 2
     HIGH = 3
     CRITICAL = 4
 
-@dataclass
+# Valores serializados precalculados (evita el acceso a .value/.name en caliente)
+_STATUS_VALUE = {status: status.value for status in TaskStatus}
+_PRIORITY_VALUE = {priority: priority.value for priority in TaskPriority}
+_PRIORITY_NAME = {priority: priority.name for priority in TaskPriority}
+
+# Prioridades en orden de despacho (de mayor a menor)
+_PRIORITIES_DESC = sorted(TaskPriority, reverse=True)
+
+# dataclass(slots=True) solo está disponible desde Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class TaskResult:
     """Resultado de una tarea"""
     task_id: str
@@ -61,7 +76,7 @@ class TaskResult:
         """Convierte el resultado a diccionario"""
         return {
             'task_id': self.task_id,
-            'status': self.status.value,
+            'status': _STATUS_VALUE[self.status],
             'data': self.data,
             'error': self.error,
             'execution_time': self.execution_time,
@@ -71,9 +86,90 @@ class TaskResult:
             'metadata': self.metadata
         }
 
+class _TimeoutWatchdog:
+    """Vigilante único de timeouts compartido por todas las tareas"""
+    
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap: List[list] = []
+        self._counter = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+    
+    def schedule(self, delay: float, callback: Callable[[], None]) -> list:
+        """
+        Programa un callback para ejecutarse tras `delay` segundos
+        
+        Returns:
+            Entrada programada, usada para cancelarla con cancel()
+        """
+        entry = [time.monotonic() + delay, next(self._counter), callback]
+        with self._cond:
+            heapq.heappush(self._heap, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    daemon=True,
+                    name="TaskWatchdog"
+                )
+                self._thread.start()
+            self._cond.notify()
+        return entry
+    
+    def cancel(self, entry: list):
+        """Cancela una entrada programada (se descarta al llegar al frente)"""
+        entry[2] = None
+    
+    def _run(self):
+        """Loop del vigilante"""
+        while True:
+            with self._cond:
+                # Descartar entradas canceladas al frente del heap
+                while self._heap and self._heap[0][2] is None:
+                    heapq.heappop(self._heap)
+                
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                
+                remaining = self._heap[0][0] - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                
+                callback = heapq.heappop(self._heap)[2]
+            
+            try:
+                callback()
+            except Exception as e:
+                logger.error("Error en callback de timeout: %s", e)
+
+_timeout_watchdog = _TimeoutWatchdog()
+
+# Estado compartido de cancelación/pausa: la mayoría de tareas nunca se
+# cancelan ni se pausan, así que basta con conjuntos de IDs en lugar de
+# primitivas de sincronización por tarea. Las escrituras se hacen bajo
+# _pause_cond; las lecturas son simples consultas de pertenencia.
+_cancelled_ids: set = set()
+_paused_ids: set = set()
+_pause_cond = threading.Condition()
+
+# Generador de IDs de tarea: únicos dentro del proceso y sin coste de entropía
+_task_counter = itertools.count().__next__
+_task_pid = os.getpid()
+
 class BaseTask(ABC):
     """Clase base abstracta para todas las tareas del sistema"""
     
+    # Atributos fijos de la tarea base; las subclases sin __slots__
+    # conservan su __dict__ para atributos propios
+    __slots__ = (
+        'task_id', '_external_id', 'name', 'description', 'priority', 'timeout',
+        'retry_count', 'dependencies', 'status', 'progress', 'start_time',
+        'execution_time', 'start_ns', 'end_ns', 'error', 'result_data',
+        'metadata', '_lock', '_timed_out',
+        'on_progress', 'on_status_change', 'on_complete'
+    )
+    
     def __init__(self, 
                  name: str,
                  description: str = "",
@@ -92,7 +188,8 @@ class BaseTask(ABC):
             retry_count: Número de reintentos
             dependencies: Lista de IDs de tareas dependientes
         """
-        self.task_id = str(uuid.uuid4())
+        self.task_id = f"{_task_pid}-{_task_counter()}"
+        self._external_id: Optional[str] = None
         self.name = name
         self.description = description
         self.priority = priority
@@ -104,23 +201,23 @@ class BaseTask(ABC):
         self.status = TaskStatus.PENDING
         self.progress = 0.0
         self.start_time: Optional[datetime] = None
-        self.end_time: Optional[datetime] = None
         self.execution_time = 0.0
+        self.start_ns = 0
+        self.end_ns = 0
         self.error: Optional[str] = None
         self.result_data: Dict[str, Any] = {}
         self.metadata: Dict[str, Any] = {}
         
         # Control de ejecución
-        self._cancelled = threading.Event()
-        self._paused = threading.Event()
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
+        self._timed_out = False
         
         # Callbacks
         self.on_progress: Optional[Callable[[float], None]] = None
         self.on_status_change: Optional[Callable[[TaskStatus], None]] = None
         self.on_complete: Optional[Callable[[TaskResult], None]] = None
         
-        logger.debug(f"Tarea creada: {self.name} (ID: {self.task_id})")
+        logger.debug("Tarea creada: %s (ID: %s)", self.name, self.task_id)
     
     @abstractmethod
     def execute(self) -> Dict[str, Any]:
@@ -141,20 +238,21 @@ class BaseTask(ABC):
         """
         with self._lock:
             if self.status != TaskStatus.PENDING:
-                logger.warning(f"Intento de ejecutar tarea {self.name} en estado {self.status.value}")
+                logger.warning("Intento de ejecutar tarea %s en estado %s", self.name, self.status.value)
                 return self._create_result()
             
             self.status = TaskStatus.RUNNING
+            self.start_ns = time.monotonic_ns()
             self.start_time = datetime.now()
             self.progress = 0.0
-            
+        
         self._notify_status_change(self.status)
         
         try:
-            logger.info(f"Iniciando ejecución de tarea: {self.name}")
+            logger.info("Iniciando ejecución de tarea: %s", self.name)
             
             # Verificar si la tarea fue cancelada antes de comenzar
-            if self._cancelled.is_set():
+            if self.task_id in _cancelled_ids:
                 self._set_status(TaskStatus.CANCELLED)
                 return self._create_result()
             
@@ -162,7 +260,7 @@ class BaseTask(ABC):
             result_data = self._execute_with_timeout()
             
             # Verificar cancelación después de ejecución
-            if self._cancelled.is_set():
+            if self.task_id in _cancelled_ids:
                 self._set_status(TaskStatus.CANCELLED)
                 return self._create_result()
             
@@ -172,22 +270,24 @@ class BaseTask(ABC):
                 self.progress = 100.0
                 self._set_status(TaskStatus.COMPLETED)
             
-            logger.info(f"Tarea completada: {self.name} en {self.execution_time:.3f}s")
+            logger.info("Tarea completada: %s en %.3fs", self.name, self.execution_time)
             
         except TimeoutError:
-            logger.error(f"Timeout en tarea {self.name} después de {self.timeout}s")
+            logger.error("Timeout en tarea %s después de %ss", self.name, self.timeout)
             self._set_status(TaskStatus.TIMEOUT, "Tiempo de ejecución excedido")
             
         except Exception as e:
             error_msg = f"Error en tarea {self.name}: {str(e)}"
-            logger.error(f"{error_msg}\n{traceback.format_exc()}")
+            logger.error(error_msg, exc_info=True)
             self._set_status(TaskStatus.FAILED, error_msg)
         
         finally:
             with self._lock:
-                self.end_time = datetime.now()
-                if self.start_time:
-                    self.execution_time = (self.end_time - self.start_time).total_seconds()
+                self.end_ns = time.monotonic_ns()
+                self.execution_time = (self.end_ns - self.start_ns) / 1e9
+            with _pause_cond:
+                _cancelled_ids.discard(self.task_id)
+                _paused_ids.discard(self.task_id)
         
         result = self._create_result()
         
@@ -196,50 +296,61 @@ class BaseTask(ABC):
             try:
                 self.on_complete(result)
             except Exception as e:
-                logger.error(f"Error en callback de finalización: {e}")
+                logger.error("Error en callback de finalización: %s", e)
         
         return result
     
     def _execute_with_timeout(self) -> Dict[str, Any]:
-        """Ejecuta la tarea con control de timeout"""
-        result_queue = queue.Queue()
-        exception_queue = queue.Queue()
-        
-        def target():
-            try:
-                result = self.execute()
-                result_queue.put(result)
-            except Exception as e:
-                exception_queue.put(e)
-        
-        thread = threading.Thread(target=target, daemon=True)
-        thread.start()
+        """
+        Ejecuta la tarea en el hilo actual con control cooperativo de timeout
         
-        # Esperar con verificación periódica de cancelación
-        elapsed_time = 0
-        check_interval = 0.1  # Verificar cada 100ms
+        El vigilante compartido marca la tarea como cancelada al vencer el
+        plazo; las tareas deben consultar is_cancelled() para detenerse. Si
+        el plazo venció, la ejecución se informa como timeout aunque execute()
+        haya terminado sin atender la cancelación.
+        """
+        if not self.timeout:
+            return self.execute()
         
-        while thread.is_alive() and elapsed_time < self.timeout:
-            if self._cancelled.is_set():
-                logger.info(f"Tarea {self.name} cancelada durante ejecución")
-                return {}
-            
-            time.sleep(check_interval)
-            elapsed_time += check_interval
+        self._timed_out = False
+        handle = _timeout_watchdog.schedule(self.timeout, self._on_timeout)
+        try:
+            result = self.execute()
+        finally:
+            _timeout_watchdog.cancel(handle)
         
-        if thread.is_alive():
-            # Timeout alcanzado
+        if self._timed_out:
             raise TimeoutError(f"Tarea excedió timeout de {self.timeout}s")
         
-        # Verificar si hubo excepción
-        if not exception_queue.empty():
-            raise exception_queue.get()
-        
-        # Obtener resultado
-        if not result_queue.empty():
-            return result_queue.get()
-        
-        return {}
+        return result
+    
+    def _on_timeout(self):
+        """Callback del vigilante cuando la tarea excede su timeout"""
+        with self._lock:
+            if self.status not in (TaskStatus.RUNNING, TaskStatus.PAUSED):
+                return
+            self._timed_out = True
+            self._request_cancel()
+    
+    def _request_cancel(self):
+        """Marca la tarea como cancelada y despierta si estaba en pausa"""
+        with _pause_cond:
+            _cancelled_ids.add(self.task_id)
+            _pause_cond.notify_all()
+    
+    @property
+    def external_id(self) -> str:
+        """UUID (RFC 4122) de la tarea, generado solo si se solicita"""
+        if self._external_id is None:
+            self._external_id = str(uuid.uuid4())
+        return self._external_id
+    
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """Hora de finalización, derivada del inicio y la duración monotónica"""
+        if not self.end_ns or self.start_time is None:
+            return None
+        return self.start_time + timedelta(microseconds=(self.end_ns - self.start_ns) // 1000)
     
     def _set_status(self, status: TaskStatus, error: str = None):
         """Establece el estado de la tarea"""
@@ -256,47 +367,55 @@ class BaseTask(ABC):
             try:
                 self.on_status_change(status)
             except Exception as e:
-                logger.error(f"Error en callback de cambio de estado: {e}")
+                logger.error("Error en callback de cambio de estado: %s", e)
     
     def _create_result(self) -> TaskResult:
-        """Crea el resultado de la tarea"""
+        """
+        Crea el resultado de la tarea
+        
+        Los datos y metadatos se comparten por referencia: el resultado se
+        crea al finalizar la tarea, cuando ya no se modifican.
+        """
         return TaskResult(
             task_id=self.task_id,
             status=self.status,
-            data=self.result_data.copy(),
+            data=self.result_data,
             error=self.error,
             execution_time=self.execution_time,
             start_time=self.start_time,
             end_time=self.end_time,
             progress=self.progress,
-            metadata=self.metadata.copy()
+            metadata=self.metadata
         )
     
     def cancel(self):
         """Cancela la tarea"""
         with self._lock:
-            if self.status == TaskStatus.RUNNING:
-                self._cancelled.set()
-                logger.info(f"Solicitada cancelación de tarea: {self.name}")
+            if self.status in (TaskStatus.RUNNING, TaskStatus.PAUSED):
+                self._request_cancel()
+                logger.info("Solicitada cancelación de tarea: %s", self.name)
             elif self.status == TaskStatus.PENDING:
                 self._set_status(TaskStatus.CANCELLED)
-                logger.info(f"Tarea cancelada: {self.name}")
+                logger.info("Tarea cancelada: %s", self.name)
     
     def pause(self):
         """Pausa la tarea (si está en ejecución)"""
         with self._lock:
             if self.status == TaskStatus.RUNNING:
-                self._paused.set()
+                with _pause_cond:
+                    _paused_ids.add(self.task_id)
                 self._set_status(TaskStatus.PAUSED)
-                logger.info(f"Tarea pausada: {self.name}")
+                logger.info("Tarea pausada: %s", self.name)
     
     def resume(self):
         """Reanuda la tarea pausada"""
         with self._lock:
             if self.status == TaskStatus.PAUSED:
-                self._paused.clear()
+                with _pause_cond:
+                    _paused_ids.discard(self.task_id)
+                    _pause_cond.notify_all()
                 self._set_status(TaskStatus.RUNNING)
-                logger.info(f"Tarea reanudada: {self.name}")
+                logger.info("Tarea reanudada: %s", self.name)
     
     def update_progress(self, progress: float, message: str = ""):
         """
@@ -315,21 +434,46 @@ class BaseTask(ABC):
             try:
                 self.on_progress(self.progress)
             except Exception as e:
-                logger.error(f"Error en callback de progreso: {e}")
+                logger.error("Error en callback de progreso: %s", e)
+    
+    def checkpoint(self, progress: float, message: str = "") -> bool:
+        """
+        Punto de control entre fases de execute()
+        
+        Espera si la tarea está pausada y, si no fue cancelada (ni por el
+        usuario ni por timeout), actualiza el progreso.
+        
+        Args:
+            progress: Progreso de 0.0 a 100.0 al empezar la fase
+            message: Mensaje de progreso opcional
+            
+        Returns:
+            False si la tarea fue cancelada y execute() debe terminar
+        """
+        self.wait_if_paused()
+        if self.is_cancelled():
+            logger.info("Tarea %s cancelada", self.name)
+            return False
+        
+        self.update_progress(progress, message)
+        return True
     
     def is_cancelled(self) -> bool:
         """Verifica si la tarea fue cancelada"""
-        return self._cancelled.is_set()
+        return self.task_id in _cancelled_ids
     
     def is_paused(self) -> bool:
         """Verifica si la tarea está pausada"""
-        return self._paused.is_set()
+        return self.task_id in _paused_ids
     
     def wait_if_paused(self):
-        """Espera si la tarea está pausada"""
-        if self._paused.is_set():
-            logger.debug(f"Tarea {self.name} esperando reanudación...")
-            self._paused.wait()
+        """Espera si la tarea está pausada (hasta reanudación o cancelación)"""
+        if self.task_id in _paused_ids:
+            logger.debug("Tarea %s esperando reanudación...", self.name)
+            with _pause_cond:
+                _pause_cond.wait_for(
+                    lambda: self.task_id not in _paused_ids or self.task_id in _cancelled_ids
+                )
     
     def get_info(self) -> Dict[str, Any]:
         """Obtiene información completa de la tarea"""
@@ -338,8 +482,8 @@ class BaseTask(ABC):
                 'task_id': self.task_id,
                 'name': self.name,
                 'description': self.description,
-                'priority': self.priority.value,
-                'status': self.status.value,
+                'priority': _PRIORITY_VALUE[self.priority],
+                'status': _STATUS_VALUE[self.status],
                 'progress': self.progress,
                 'timeout': self.timeout,
                 'retry_count': self.retry_count,
@@ -367,23 +511,31 @@ class TaskScheduler:
             thread_name_prefix="TaskWorker"
         )
         
-        # Colas de tareas por prioridad
-        self.task_queues = {
-            TaskPriority.CRITICAL: queue.PriorityQueue(),
-            TaskPriority.HIGH: queue.PriorityQueue(),
-            TaskPriority.NORMAL: queue.PriorityQueue(),
-            TaskPriority.LOW: queue.PriorityQueue()
-        }
+        # Colas de tareas indexadas por valor de prioridad (LIFO dentro de
+        # cada prioridad; la posición 0 no se usa)
+        self.task_queues: List[deque] = [deque() for _ in range(max(TaskPriority) + 1)]
         
         # Control del scheduler
         self.is_running = False
         self.scheduler_thread = None
         self.stop_event = threading.Event()
+        self._work_available = threading.Event()
         
         # Seguimiento de tareas
         self.tasks: Dict[str, BaseTask] = {}
-        self.running_tasks: Dict[str, Future] = {}
-        self.completed_tasks: Dict[str, TaskResult] = {}
+        self.running_tasks: Dict[str, Optional[Future]] = {}
+        self.completed_tasks: Dict[str, TaskResult] = OrderedDict()
+        self.max_completed_tasks = 1000
+        
+        # Futures de espera por tarea, resueltos al registrar su resultado
+        self.task_futures: Dict[str, Future] = {}
+        
+        # Índice inverso de dependencias y contador de dependencias pendientes
+        self.dependents: Dict[str, List[str]] = {}
+        self.remaining_deps: Dict[str, int] = {}
+        
+        # Tareas encoladas canceladas antes de despacharse
+        self.cancelled_ids: set = set()
         
         # Estadísticas
         self.stats = {
@@ -391,13 +543,22 @@ class TaskScheduler:
             'completed_tasks': 0,
             'failed_tasks': 0,
             'cancelled_tasks': 0,
-            'average_execution_time': 0.0
+            'total_execution_time_ns': 0
         }
         
-        # Lock para operaciones thread-safe
-        self._lock = threading.Lock()
+        # Un lock por grupo de estructuras; cada estructura se modifica solo
+        # con su lock. Orden de adquisición cuando se anidan:
+        #   _completed_lock -> _running_lock -> _tasks_lock
+        # _lock y _stats_lock nunca se anidan con otros. Los futures no se
+        # cancelan ni resuelven con ningún lock tomado (sus callbacks los retoman)
+        self._lock = threading.Lock()            # ciclo de vida (start/stop)
+        self._completed_lock = threading.Lock()  # task_queues, cancelled_ids, dependents,
+                                                 # remaining_deps, completed_tasks, task_futures
+        self._running_lock = threading.Lock()    # running_tasks
+        self._tasks_lock = threading.Lock()      # tasks
+        self._stats_lock = threading.Lock()      # stats
         
-        logger.info(f"TaskScheduler inicializado con {max_workers} workers")
+        logger.info("TaskScheduler inicializado con %s workers", max_workers)
     
     def start(self):
         """Inicia el scheduler"""
@@ -431,6 +592,7 @@ class TaskScheduler:
             
             self.is_running = False
             self.stop_event.set()
+            self._work_available.set()
         
         logger.info("Deteniendo TaskScheduler...")
         
@@ -457,24 +619,38 @@ class TaskScheduler:
         Returns:
             ID de la tarea
         """
-        with self._lock:
-            # Verificar dependencias
-            for dep_id in task.dependencies:
-                if dep_id not in self.tasks and dep_id not in self.completed_tasks:
-                    raise ValueError(f"Dependencia no encontrada: {dep_id}")
-            
-            # Añadir tarea
-            self.tasks[task.task_id] = task
-            self.stats['total_tasks'] += 1
-            
-            # Encolar tarea
-            priority_value = task.priority.value
-            timestamp = time.time()
-            self.task_queues[task.priority].put((priority_value, timestamp, task.task_id))
+        with self._completed_lock:
+            # Verificar dependencias y quedarse con las aún no completadas
+            pending_deps = []
+            with self._tasks_lock:
+                for dep_id in dict.fromkeys(task.dependencies):
+                    if dep_id in self.completed_tasks:
+                        continue
+                    if dep_id not in self.tasks:
+                        raise ValueError(f"Dependencia no encontrada: {dep_id}")
+                    pending_deps.append(dep_id)
+                
+                # Añadir tarea
+                self.tasks[task.task_id] = task
+            self.task_futures[task.task_id] = Future()
             
-            logger.debug(f"Tarea añadida: {task.name} (Prioridad: {task.priority.name})")
+            # Registrar dependencias pendientes en el índice inverso
+            for dep_id in pending_deps:
+                self.dependents.setdefault(dep_id, []).append(task.task_id)
             
-            return task.task_id
+            # Encolar tarea solo si no tiene dependencias pendientes
+            if pending_deps:
+                self.remaining_deps[task.task_id] = len(pending_deps)
+            else:
+                self.task_queues[task.priority].append(task.task_id)
+                self._work_available.set()
+        
+        with self._stats_lock:
+            self.stats['total_tasks'] += 1
+        
+        logger.debug("Tarea añadida: %s (Prioridad: %s)", task.name, task.priority.name)
+        
+        return task.task_id
     
     def remove_task(self, task_id: str) -> bool:
         """
@@ -486,22 +662,31 @@ class TaskScheduler:
         Returns:
             True si se eliminó exitosamente
         """
-        with self._lock:
-            # Verificar si está en ejecución
-            if task_id in self.running_tasks:
-                future = self.running_tasks[task_id]
-                future.cancel()
-                del self.running_tasks[task_id]
-            
-            # Eliminar de tareas pendientes
-            if task_id in self.tasks:
-                task = self.tasks[task_id]
-                task.cancel()
-                del self.tasks[task_id]
-                logger.info(f"Tarea eliminada: {task.name}")
-                return True
+        with self._completed_lock:
+            # Retirar a quien espere la tarea eliminada
+            waiter = self.task_futures.pop(task_id, None)
             
-            return False
+            with self._tasks_lock:
+                # Eliminar de tareas pendientes
+                task = self.tasks.pop(task_id, None)
+        
+        with self._running_lock:
+            # Verificar si está en ejecución
+            future = self.running_tasks.pop(task_id, None)
+        
+        # Cancelar fuera de los locks: Future.cancel() ejecuta en este hilo
+        # los callbacks (_on_task_done), que vuelven a tomarlos
+        if future is not None:
+            future.cancel()
+        if waiter is not None:
+            waiter.cancel()
+        
+        if task is not None:
+            task.cancel()
+            logger.info("Tarea eliminada: %s", task.name)
+            return True
+        
+        return False
     
     def get_task(self, task_id: str) -> Optional[BaseTask]:
         """
@@ -513,7 +698,8 @@ class TaskScheduler:
         Returns:
             Tarea o None si no existe
         """
-        return self.tasks.get(task_id)
+        with self._tasks_lock:
+            return self.tasks.get(task_id)
     
     def get_task_result(self, task_id: str) -> Optional[TaskResult]:
         """
@@ -525,7 +711,22 @@ class TaskScheduler:
         Returns:
             Resultado de la tarea o None
         """
-        return self.completed_tasks.get(task_id)
+        with self._completed_lock:
+            return self.completed_tasks.get(task_id)
+    
+    def get_task_future(self, task_id: str) -> Optional[Future]:
+        """
+        Obtiene el Future que se resuelve con el resultado de una tarea
+        
+        Args:
+            task_id: ID de la tarea
+            
+        Returns:
+            Future con el TaskResult, o None si la tarea no existe o su
+            resultado ya salió del historial
+        """
+        with self._completed_lock:
+            return self.task_futures.get(task_id)
     
     def cancel_task(self, task_id: str) -> bool:
         """
@@ -537,39 +738,58 @@ class TaskScheduler:
         Returns:
             True si se canceló exitosamente
         """
-        with self._lock:
-            # Cancelar si está en ejecución
-            if task_id in self.running_tasks:
-                future = self.running_tasks[task_id]
-                if future.cancel():
-                    del self.running_tasks[task_id]
-                    return True
+        future = None
+        with self._completed_lock:
+            with self._tasks_lock:
+                task = self.tasks.get(task_id)
             
-            # Cancelar si está pendiente
-            if task_id in self.tasks:
-                task = self.tasks[task_id]
-                task.cancel()
+            # El despacho pasa las tareas de la cola a running_tasks con
+            # _completed_lock tomado, así que aquí no puede estar a medio camino
+            with self._running_lock:
+                running = task_id in self.running_tasks
+                if running:
+                    future = self.running_tasks[task_id]
+            
+            if not running:
+                if task is None:
+                    return False
+                if task_id in self.cancelled_ids:
+                    return True
+                if self.remaining_deps.pop(task_id, None) is None:
+                    # En cola: marcar para que el despacho la descarte sin ejecutarla
+                    self.cancelled_ids.add(task_id)
+        
+        if running:
+            # Cancelar si aún no ha empezado en el executor; fuera del lock
+            # porque _on_task_done se ejecuta aquí mismo y lo vuelve a tomar
+            if future is not None and future.cancel():
                 return True
             
-            return False
+            # En ejecución: cancelación cooperativa
+            if task is not None:
+                task.cancel()
+            return True
+        
+        # Pendiente: se registra directamente como cancelada
+        task.cancel()
+        self._record_result(task, task._create_result())
+        return True
     
     def pause_task(self, task_id: str) -> bool:
         """Pausa una tarea en ejecución"""
-        with self._lock:
-            if task_id in self.tasks:
-                task = self.tasks[task_id]
-                task.pause()
-                return True
-            return False
+        task = self.get_task(task_id)
+        if task is not None:
+            task.pause()
+            return True
+        return False
     
     def resume_task(self, task_id: str) -> bool:
         """Reanuda una tarea pausada"""
-        with self._lock:
-            if task_id in self.tasks:
-                task = self.tasks[task_id]
-                task.resume()
-                return True
-            return False
+        task = self.get_task(task_id)
+        if task is not None:
+            task.resume()
+            return True
+        return False
     
     def _scheduler_loop(self):
         """Loop principal del scheduler"""
@@ -577,23 +797,19 @@ class TaskScheduler:
         
         while not self.stop_event.is_set():
             try:
+                # Esperar hasta que haya trabajo o capacidad disponible
+                self._work_available.wait(timeout=1.0)
+                self._work_available.clear()
+                
                 # Procesar tareas por prioridad
-                for priority in [TaskPriority.CRITICAL, TaskPriority.HIGH, 
-                               TaskPriority.NORMAL, TaskPriority.LOW]:
-                    
+                for priority in _PRIORITIES_DESC:
                     if self.stop_event.is_set():
                         break
                     
                     self._process_priority_queue(priority)
                 
-                # Limpiar tareas completadas
-                self._cleanup_completed_tasks()
-                
-                # Pequeña pausa para evitar uso excesivo de CPU
-                time.sleep(0.1)
-                
             except Exception as e:
-                logger.error(f"Error en loop del scheduler: {e}")
+                logger.error("Error en loop del scheduler: %s", e)
                 time.sleep(1)
         
         logger.debug("Loop del scheduler terminado")
@@ -601,157 +817,205 @@ class TaskScheduler:
     def _process_priority_queue(self, priority: TaskPriority):
         """Procesa la cola de una prioridad específica"""
         queue_obj = self.task_queues[priority]
+        if not queue_obj:
+            return
         
-        while not queue_obj.empty() and len(self.running_tasks) < self.max_workers:
-            try:
-                _, _, task_id = queue_obj.get_nowait()
-                
-                if task_id not in self.tasks:
+        # Reservar en una sola sección crítica los huecos para las tareas listas
+        ready: List[BaseTask] = []
+        with self._completed_lock, self._running_lock:
+            capacity = self.max_workers - len(self.running_tasks)
+            while queue_obj and len(ready) < capacity:
+                task_id = queue_obj.pop()
+                if task_id in self.cancelled_ids:
+                    self.cancelled_ids.discard(task_id)
                     continue
                 
-                task = self.tasks[task_id]
-                
-                # Verificar dependencias
-                if not self._dependencies_completed(task):
-                    # Re-encolar para más tarde
-                    queue_obj.put((priority.value, time.time(), task_id))
-                    break
-                
-                # Ejecutar tarea
-                future = self.executor.submit(self._execute_task, task)
-                self.running_tasks[task_id] = future
-                
-                logger.debug(f"Tarea enviada a ejecución: {task.name}")
+                with self._tasks_lock:
+                    task = self.tasks.get(task_id)
+                if task is None:
+                    continue
                 
-            except queue.Empty:
-                break
+                # Marcador hasta que se registre el future
+                self.running_tasks[task.task_id] = None
+                ready.append(task)
+        
+        if not ready:
+            return
+        
+        # Enviar a ejecución fuera del lock
+        futures: Dict[str, Optional[Future]] = {}
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        for task in ready:
+            try:
+                future = self.executor.submit(task.run)
+                future.add_done_callback(lambda f, t=task: self._on_task_done(t, f))
+                futures[task.task_id] = future
+                if debug_enabled:
+                    logger.debug("Tarea enviada a ejecución: %s", task.name)
             except Exception as e:
-                logger.error(f"Error procesando cola {priority.name}: {e}")
-    
-    def _dependencies_completed(self, task: BaseTask) -> bool:
-        """Verifica si las dependencias de una tarea están completadas"""
-        for dep_id in task.dependencies:
-            if dep_id in self.tasks:
-                dep_task = self.tasks[dep_id]
-                if dep_task.status != TaskStatus.COMPLETED:
-                    return False
-            elif dep_id not in self.completed_tasks:
-                return False
+                futures[task.task_id] = None
+                logger.error("Error procesando cola %s: %s", priority.name, e)
         
-        return True
+        # Registrar los futures (omitiendo tareas que ya terminaron)
+        with self._running_lock:
+            for task_id, future in futures.items():
+                if task_id not in self.running_tasks:
+                    continue
+                if future is None:
+                    del self.running_tasks[task_id]
+                else:
+                    self.running_tasks[task_id] = future
     
-    def _execute_task(self, task: BaseTask) -> TaskResult:
-        """Ejecuta una tarea y maneja el resultado"""
-        try:
-            result = task.run()
+    def _release_dependents(self, task_id: str):
+        """Encola las tareas dependientes que ya no tienen dependencias pendientes"""
+        for child_id in self.dependents.pop(task_id, []):
+            remaining = self.remaining_deps.get(child_id)
+            if remaining is None:
+                # Tarea cancelada mientras esperaba sus dependencias
+                continue
             
-            with self._lock:
-                # Mover tarea a completadas
-                if task.task_id in self.tasks:
-                    del self.tasks[task.task_id]
-                
-                self.completed_tasks[task.task_id] = result
-                
-                # Actualizar estadísticas
-                if result.status == TaskStatus.COMPLETED:
-                    self.stats['completed_tasks'] += 1
-                elif result.status == TaskStatus.FAILED:
-                    self.stats['failed_tasks'] += 1
-                elif result.status == TaskStatus.CANCELLED:
-                    self.stats['cancelled_tasks'] += 1
-                
-                # Actualizar tiempo promedio de ejecución
-                if self.stats['completed_tasks'] > 0:
-                    total_time = (self.stats['average_execution_time'] * 
-                                (self.stats['completed_tasks'] - 1) + result.execution_time)
-                    self.stats['average_execution_time'] = total_time / self.stats['completed_tasks']
+            remaining -= 1
+            if remaining > 0:
+                self.remaining_deps[child_id] = remaining
+                continue
+            
+            self.remaining_deps.pop(child_id, None)
+            with self._tasks_lock:
+                child = self.tasks.get(child_id)
+            if child:
+                self.task_queues[child.priority].append(child_id)
+    
+    def _on_task_done(self, task: BaseTask, future: Future):
+        """Registra el resultado de una tarea al completarse su future"""
+        try:
+            if future.cancelled():
+                task.cancel()
+                result = task._create_result()
+            elif future.exception() is not None:
+                logger.error("Error ejecutando tarea %s: %s", task.name, future.exception())
+                result = TaskResult(
+                    task_id=task.task_id,
+                    status=TaskStatus.FAILED,
+                    error=str(future.exception())
+                )
+            else:
+                result = future.result()
             
-            return result
+            self._record_result(task, result)
             
         except Exception as e:
-            logger.error(f"Error ejecutando tarea {task.name}: {e}")
-            return TaskResult(
-                task_id=task.task_id,
-                status=TaskStatus.FAILED,
-                error=str(e)
-            )
+            logger.error("Error registrando resultado de tarea %s: %s", task.name, e)
         finally:
             # Limpiar de tareas en ejecución
-            with self._lock:
+            with self._running_lock:
                 if task.task_id in self.running_tasks:
                     del self.running_tasks[task.task_id]
+            
+            # Notificar al scheduler que hay capacidad libre
+            self._work_available.set()
     
-    def _cleanup_completed_tasks(self, max_completed: int = 1000):
-        """Limpia tareas completadas antiguas"""
-        with self._lock:
-            if len(self.completed_tasks) > max_completed:
-                # Mantener solo las más recientes
-                sorted_tasks = sorted(
-                    self.completed_tasks.items(),
-                    key=lambda x: x[1].end_time or datetime.min,
-                    reverse=True
-                )
-                
-                # Mantener solo las más recientes
-                self.completed_tasks = dict(sorted_tasks[:max_completed])
-                
-                logger.debug(f"Limpieza de tareas: mantenidas {len(self.completed_tasks)} de {len(sorted_tasks)}")
+    def _record_result(self, task: BaseTask, result: TaskResult):
+        """Registra el resultado final de una tarea y libera sus dependientes"""
+        with self._completed_lock:
+            # Mover tarea a completadas (antes de retirarla de tasks para
+            # que add_task siempre encuentre la dependencia en alguna)
+            self.completed_tasks[task.task_id] = result
+            self._release_dependents(task.task_id)
+            
+            # Future de espera, resuelto fuera del lock (sus callbacks corren aquí)
+            waiter = self.task_futures.get(task.task_id)
+            
+            # Descartar las tareas completadas más antiguas
+            while len(self.completed_tasks) > self.max_completed_tasks:
+                evicted_id, _ = self.completed_tasks.popitem(last=False)
+                self.task_futures.pop(evicted_id, None)
+            
+            with self._tasks_lock:
+                self.tasks.pop(task.task_id, None)
+        
+        # Despertar a quien espere el resultado
+        if waiter is not None and not waiter.done():
+            waiter.set_result(result)
+        
+        execution_ns = task.end_ns - task.start_ns if task.end_ns else 0
+        
+        with self._stats_lock:
+            # Actualizar estadísticas (el promedio se calcula en get_status)
+            if result.status == TaskStatus.COMPLETED:
+                self.stats['completed_tasks'] += 1
+                self.stats['total_execution_time_ns'] += execution_ns
+            elif result.status == TaskStatus.FAILED:
+                self.stats['failed_tasks'] += 1
+            elif result.status == TaskStatus.CANCELLED:
+                self.stats['cancelled_tasks'] += 1
     
     def _cancel_running_tasks(self):
         """Cancela todas las tareas en ejecución"""
-        with self._lock:
-            for task_id, future in list(self.running_tasks.items()):
-                try:
-                    future.cancel()
-                    if task_id in self.tasks:
-                        self.tasks[task_id].cancel()
-                except Exception as e:
-                    logger.error(f"Error cancelando tarea {task_id}: {e}")
-            
+        with self._running_lock:
+            running = list(self.running_tasks.items())
             self.running_tasks.clear()
+        
+        # Cancelar fuera del lock: los callbacks de los futures lo retoman
+        for task_id, future in running:
+            try:
+                if future:
+                    future.cancel()
+                with self._tasks_lock:
+                    task = self.tasks.get(task_id)
+                if task is not None:
+                    task.cancel()
+            except Exception as e:
+                logger.error("Error cancelando tarea %s: %s", task_id, e)
     
     def get_status(self) -> Dict[str, Any]:
         """Obtiene el estado actual del scheduler"""
-        with self._lock:
-            pending_count = sum(queue_obj.qsize() for queue_obj in self.task_queues.values())
-            
-            return {
-                'is_running': self.is_running,
-                'max_workers': self.max_workers,
-                'pending_tasks': pending_count,
-                'running_tasks': len(self.running_tasks),
-                'completed_tasks': len(self.completed_tasks),
-                'total_tasks_processed': self.stats['total_tasks'],
-                'successful_tasks': self.stats['completed_tasks'],
-                'failed_tasks': self.stats['failed_tasks'],
-                'cancelled_tasks': self.stats['cancelled_tasks'],
-                'average_execution_time': self.stats['average_execution_time'],
-                'queue_sizes': {
-                    priority.name: queue_obj.qsize() 
-                    for priority, queue_obj in self.task_queues.items()
-                }
+        # Las lecturas de len() son atómicas; solo stats requiere una copia consistente
+        with self._stats_lock:
+            stats = self.stats.copy()
+        
+        pending_count = sum(len(queue_obj) for queue_obj in self.task_queues)
+        
+        average_execution_time = 0.0
+        if stats['completed_tasks']:
+            average_execution_time = stats['total_execution_time_ns'] / stats['completed_tasks'] / 1e9
+        
+        return {
+            'is_running': self.is_running,
+            'max_workers': self.max_workers,
+            'pending_tasks': pending_count,
+            'blocked_tasks': len(self.remaining_deps),
+            'running_tasks': len(self.running_tasks),
+            'completed_tasks': len(self.completed_tasks),
+            'total_tasks_processed': stats['total_tasks'],
+            'successful_tasks': stats['completed_tasks'],
+            'failed_tasks': stats['failed_tasks'],
+            'cancelled_tasks': stats['cancelled_tasks'],
+            'average_execution_time': average_execution_time,
+            'queue_sizes': {
+                _PRIORITY_NAME[priority]: len(self.task_queues[priority])
+                for priority in _PRIORITIES_DESC
             }
+        }
     
     def get_all_tasks(self) -> Dict[str, Dict[str, Any]]:
         """Obtiene información de todas las tareas"""
-        with self._lock:
-            all_tasks = {}
-            
-            # Tareas pendientes y en ejecución
-            for task_id, task in self.tasks.items():
-                all_tasks[task_id] = task.get_info()
-            
-            # Tareas completadas (últimas 100)
-            sorted_completed = sorted(
-                self.completed_tasks.items(),
-                key=lambda x: x[1].end_time or datetime.min,
-                reverse=True
-            )[:100]
-            
-            for task_id, result in sorted_completed:
-                all_tasks[task_id] = result.to_dict()
-            
-            return all_tasks
+        all_tasks = {}
+        
+        # Tareas pendientes y en ejecución
+        with self._tasks_lock:
+            active_tasks = list(self.tasks.items())
+        
+        for task_id, task in active_tasks:
+            all_tasks[task_id] = task.get_info()
+        
+        # Tareas completadas (últimas 100, en orden de finalización)
+        with self._completed_lock:
+            recent_completed = list(itertools.islice(reversed(self.completed_tasks.items()), 100))
+        
+        for task_id, result in recent_completed:
+            all_tasks[task_id] = result.to_dict()
+        
+        return all_tasks
 
 # Singleton para el scheduler global
 class GlobalTaskScheduler:
@@ -769,7 +1033,19 @@ class GlobalTaskScheduler:
     @classmethod
     def get_instance(cls) -> TaskScheduler:
         """Obtiene la instancia del scheduler global"""
-        return cls()
+        return get_global_scheduler()
+
+def get_global_scheduler() -> TaskScheduler:
+    """
+    Obtiene el scheduler global
+    
+    Una vez creado se devuelve directamente, sin pasar por __new__ ni por
+    el lock de inicialización.
+    """
+    scheduler = GlobalTaskScheduler._instance
+    if scheduler is None:
+        scheduler = GlobalTaskScheduler()
+    return scheduler
 
 # Funciones de utilidad
 def create_task_chain(tasks: List[BaseTask]) -> List[str]:
@@ -785,7 +1061,7 @@ def create_task_chain(tasks: List[BaseTask]) -> List[str]:
     if not tasks:
         return []
     
-    scheduler = GlobalTaskScheduler.get_instance()
+    scheduler = get_global_scheduler()
     task_ids = []
     
     for i, task in enumerate(tasks):
@@ -796,7 +1072,7 @@ def create_task_chain(tasks: List[BaseTask]) -> List[str]:
         task_id = scheduler.add_task(task)
         task_ids.append(task_id)
     
-    logger.info(f"Cadena de tareas creada: {len(tasks)} tareas")
+    logger.info("Cadena de tareas creada: %s tareas", len(tasks))
     return task_ids
 
 def wait_for_task(task_id: str, timeout: float = None) -> Optional[TaskResult]:
@@ -810,27 +1086,24 @@ def wait_for_task(task_id: str, timeout: float = None) -> Optional[TaskResult]:
     Returns:
         Resultado de la tarea o None si timeout
     """
-    scheduler = GlobalTaskScheduler.get_instance()
-    start_time = time.time()
+    scheduler = get_global_scheduler()
     
-    while True:
-        # Verificar si la tarea está completada
+    waiter = scheduler.get_task_future(task_id)
+    if waiter is None:
+        # Tarea desconocida o ya descartada del historial
         result = scheduler.get_task_result(task_id)
-        if result:
-            return result
-        
-        # Verificar timeout
-        if timeout and (time.time() - start_time) > timeout:
-            logger.warning(f"Timeout esperando tarea {task_id}")
-            return None
-        
-        # Verificar si la tarea aún existe
-        task = scheduler.get_task(task_id)
-        if not task and not result:
-            logger.warning(f"Tarea {task_id} no encontrada")
-            return None
-        
-        time.sleep(0.1)
+        if result is None:
+            logger.warning("Tarea %s no encontrada", task_id)
+        return result
+    
+    try:
+        return waiter.result(timeout=timeout or None)
+    except FutureTimeoutError:
+        logger.warning("Timeout esperando tarea %s", task_id)
+        return None
+    except CancelledError:
+        logger.warning("Tarea %s no encontrada", task_id)
+        return None
 
 # Inicialización del módulo
 def initialize_base_classes():
@@ -839,7 +1112,7 @@ def initialize_base_classes():
         logger.info("Inicializando clases base del sistema...")
         
         # Inicializar scheduler global
-        scheduler = GlobalTaskScheduler.get_instance()
+        scheduler = get_global_scheduler()
         scheduler.start()
         
         # Registrar información del sistema
@@ -851,7 +1124,7 @@ def initialize_base_classes():
         return True
         
     except Exception as e:
-        logger.error(f"Error inicializando clases base: {e}")
+        logger.error("Error inicializando clases base: %s", e)
         return False
 
 # Auto-inicialización
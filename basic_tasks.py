@@ -8,7 +8,7 @@ Descripción: Implementación de tareas básicas para análisis rápido del sist
 import time
 import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
 import platform
 import socket
@@ -19,7 +19,7 @@ try:
     import wmi
     import pythoncom # Importar pythoncom
 except ImportError as e:
-    logging.error(f"Error importando dependencias básicas y pythoncom: {e}")
+    logging.error("Error importando dependencias básicas y pythoncom: %s", e)
 
 from config_and_imports import SystemConfig, SystemConstants
 from utilities import (
@@ -32,12 +32,81 @@ from detailed_system_task import wmi_manager
 # Logger para este módulo
 logger = logging.getLogger(__name__)
 
+# Estado de COM por hilo: los workers del scheduler son de larga duración,
+# así que COM se inicializa una vez por hilo y no en cada ejecución
+_com_state = threading.local()
+
+class _ComThreadGuard:
+    """
+    Libera COM cuando termina el hilo que lo inicializó
+    
+    Se guarda en _com_state; al terminar el hilo, CPython descarta sus datos
+    threading.local desde ese mismo hilo y __del__ llama a CoUninitialize.
+    Si se destruye desde otro hilo (cierre del intérprete) no hace nada:
+    CoUninitialize solo es válido en el hilo que inicializó COM.
+    """
+    
+    def __init__(self):
+        self.thread_id = threading.get_ident()
+    
+    def __del__(self):
+        if threading.get_ident() != self.thread_id:
+            return
+        try:
+            pythoncom.CoUninitialize()
+        except Exception:
+            pass
+
+def _ensure_com():
+    """Inicializa COM en el hilo actual si aún no se ha hecho"""
+    if getattr(_com_state, 'guard', None) is None:
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+        _com_state.guard = _ComThreadGuard()
+        logger.debug("COM initialized for SystemInfoTask thread %s", threading.current_thread().name)
+
+class _FrozenDict(dict):
+    """
+    dict de solo lectura para las instantáneas en caché
+    
+    Sigue siendo un dict (se serializa a JSON y admite .get); al ser
+    inmutable, copy/deepcopy devuelven el mismo objeto.
+    """
+    
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("La instantánea en caché es de solo lectura")
+    
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
+    
+    def __reduce__(self):
+        return (_FrozenDict, (dict(self),))
+
+def _freeze(value: Any) -> Any:
+    """Convierte dicts y listas anidados en _FrozenDict y tuplas"""
+    if isinstance(value, dict):
+        return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 class SystemInfoTask(BaseTask):
     """Tarea básica para obtener información rápida del sistema"""
     
+    # Última instantánea (congelada) por configuración:
+    # {(procesos, red, hardware): (instante, datos)}
+    _cache: Dict[Tuple[bool, bool, bool], Tuple[float, Dict[str, Any]]] = {}
+    _cache_lock = threading.Lock()
+    
     def __init__(self, include_processes: bool = True,
                  include_network: bool = True,
-                 include_hardware_summary: bool = True):
+                 include_hardware_summary: bool = True,
+                 cache_ttl: float = 0.0):
         """
         Inicializa la tarea de información básica del sistema
         
@@ -45,6 +114,8 @@ class SystemInfoTask(BaseTask):
             include_processes: Incluir información de procesos
             include_network: Incluir información de red
             include_hardware_summary: Incluir resumen de hardware
+            cache_ttl: Segundos durante los que se reutiliza la última
+                instantánea (0 desactiva la caché)
         """
         super().__init__(
             name="Información Básica del Sistema",
@@ -56,15 +127,45 @@ class SystemInfoTask(BaseTask):
         self.include_processes = include_processes
         self.include_network = include_network
         self.include_hardware_summary = include_hardware_summary
+        self.cache_ttl = cache_ttl
     
     def execute(self) -> Dict[str, Any]:
-        """Ejecuta la recopilación básica de información del sistema"""
+        """
+        Ejecuta la recopilación básica de información del sistema
+        
+        Con cache_ttl > 0, las ejecuciones seguidas dentro de la ventana
+        devuelven una copia superficial de la última instantánea en lugar
+        de repetir el escaneo. La instantánea se congela una vez al
+        guardarla (dicts de solo lectura y tuplas), así que el contenido
+        anidado se comparte sin riesgo y cada acierto de caché solo copia
+        el primer nivel.
+        """
+        if self.cache_ttl <= 0:
+            return self._collect_system_info()
+        
+        key = (self.include_processes, self.include_network, self.include_hardware_summary)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            logger.debug("Reutilizando información básica del sistema en caché")
+            return dict(cached[1])
+        
+        snapshot = _freeze(self._collect_system_info())
+        with self._cache_lock:
+            SystemInfoTask._cache[key] = (time.monotonic(), snapshot)
+        
+        return dict(snapshot)
+    
+    def _collect_system_info(self) -> Dict[str, Any]:
+        """Realiza la recopilación básica de información del sistema"""
+        # Lo consulta el bloque de limpieza al final del método; queda en False
+        # porque COM se libera al terminar el hilo (ver _ComThreadGuard)
         initialized_com = False
         try:
-            # Inicializar COM para este hilo de tarea
-            pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
-            initialized_com = True
-            logger.debug("COM initialized for SystemInfoTask thread.")
+            # Inicializar COM solo si se usará WMI (resumen de hardware);
+            # queda activo hasta que termina el hilo (ver _ComThreadGuard)
+            if self.include_hardware_summary:
+                _ensure_com()
 
             logger.info("Iniciando recopilación básica de información del sistema...")
             
@@ -6,18 +6,19 @@ Descripción: Interfaz de línea de comandos completa para el sistema de monitor
 """
 
 import argparse
+import bisect
 import sys
 import os
-import json
 import time
 import signal
 import threading
+import functools
+import contextlib
+import io
+from concurrent.futures import CancelledError, TimeoutError as FutureTimeoutError, as_completed
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import logging
-from pathlib import Path
-import textwrap
-import shlex
 
 # Colores para terminal (ANSI escape codes)
 class Colors:
@@ -53,6 +54,10 @@ class Colors:
     WARNING = '\033[93m'
     ERROR = '\033[91m'
     
+    # Combinaciones en una sola secuencia SGR (equivalen a COLOR + BOLD)
+    HEADER_BOLD = '\033[95;1m'
+    INFO_BOLD = '\033[94;1m'
+    
     @staticmethod
     def colored(text: str, color: str) -> str:
         """Retorna texto con color ANSI"""
@@ -61,7 +66,42 @@ class Colors:
     @staticmethod
     def is_supported() -> bool:
         """Verifica si el terminal soporta colores ANSI"""
-        return hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+        return _COLOR_SUPPORTED
+
+# Soporte de color del terminal, evaluado una sola vez al importar
+_COLOR_SUPPORTED = hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+
+def _plain(text: str, color: str) -> str:
+    """Variante sin color de Colors.colored"""
+    return text
+
+@functools.lru_cache(maxsize=64)
+def _centered(text: str) -> str:
+    """Título centrado de los encabezados (se repiten a menudo)"""
+    return f" {text.center(58)} "
+
+# Umbrales de clasificación de métricas (ordenados) y niveles por tramo
+_LEVELS = ("good", "warning", "critical")
+_CPU_THRESHOLDS = (70, 90)
+_MEMORY_THRESHOLDS = (80, 95)
+_HEALTH_THRESHOLDS = (60, 80)
+_HEALTH_LEVELS = ("critical", "warning", "good")
+
+def _level(value: float, thresholds: Tuple[float, float] = _MEMORY_THRESHOLDS,
+           levels: Tuple[str, str, str] = _LEVELS) -> str:
+    """Nivel de color de una métrica según el tramo en que cae"""
+    return levels[bisect.bisect_right(thresholds, value)]
+
+# Rutas de acceso a las estadísticas de los resultados
+_MEMORY_USAGE_PATH = ('statistics', 'virtual_memory', 'usage_percent')
+
+def _get_path(data: Any, path: Tuple[str, ...], default: Any = None) -> Any:
+    """Recorre diccionarios anidados siguiendo path; default si falta algún tramo"""
+    for key in path:
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+    return default if data is None else data
 
 # Importar módulos del sistema
 from config_and_imports import SystemConfig, SystemConstants
@@ -74,9 +114,47 @@ from main_interface import (
 # Logger para este módulo
 logger = logging.getLogger(__name__)
 
+def _use_block_buffered_stdout():
+    """
+    Desactiva el vaciado por línea de stdout en terminal
+    
+    La salida se acumula en el buffer de stdout y se vacía en puntos
+    concretos (barra de progreso, prompts, fin de comando) en lugar de
+    emitir una escritura por cada línea impresa.
+    """
+    if getattr(sys.stdout, 'line_buffering', False) and hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+
+def _buffered_output(method):
+    """
+    Acumula la salida de un método de visualización y la emite de una vez
+    
+    Los _display_* hacen decenas de escrituras a través de self.display; con
+    este decorador se acumulan en memoria y llegan a stdout en una sola escritura.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.display.buffered():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+# Módulo traceback, importado la primera vez que se necesita
+_traceback = None
+
+def _get_tb():
+    """Devuelve el módulo traceback, importándolo solo en el primer uso"""
+    global _traceback
+    if _traceback is None:
+        import traceback
+        _traceback = traceback
+    return _traceback
+
 class ProgressBar:
     """Barra de progreso para CLI"""
     
+    # Parte variable de la línea: porcentaje, ETA, mensaje y fin de línea
+    _TAIL_TEMPLATE = '| {:.1f}% {}{}{}'
+    
     def __init__(self, total: int = 100, width: int = 50, 
                  prefix: str = "Progreso", suffix: str = "Completo"):
         self.total = total
@@ -85,39 +163,68 @@ class ProgressBar:
         self.suffix = suffix
         self.current = 0
         self.start_time = time.time()
+        
+        # Barras precalculadas para cada número de celdas rellenas
+        self._bars = ['█' * i + '░' * (width - i) for i in range(width + 1)]
+        self._last_key = None
+        self._eta_str = "ETA: --s"
+        self._eta_time = 0.0
+        
+        self._line_prefix = f'\r{prefix} |'
     
     def update(self, current: int, message: str = ""):
         """Actualiza la barra de progreso"""
         self.current = current
         percent = (current / self.total) * 100
-        filled_length = int(self.width * current // self.total)
-        bar = '█' * filled_length + '░' * (self.width - filled_length)
+        completed = current >= self.total
         
-        # Calcular tiempo estimado
-        elapsed = time.time() - self.start_time
-        if current > 0:
-            eta = (elapsed / current) * (self.total - current)
-            eta_str = f"ETA: {int(eta)}s"
-        else:
-            eta_str = "ETA: --s"
+        # Omitir la escritura si no cambia el porcentaje entero ni el mensaje
+        key = (int(percent), message)
+        if key == self._last_key and not completed:
+            return
+        self._last_key = key
         
-        # Formatear mensaje
-        if message:
-            display_message = f" | {message[:30]}"
-        else:
-            display_message = ""
+        filled_length = min(self.width, int(self.width * current // self.total))
         
-        # Imprimir barra
-        sys.stdout.write(f'\r{self.prefix} |{bar}| {percent:.1f}% {eta_str}{display_message}')
-        sys.stdout.flush()
+        # Calcular tiempo estimado (como mucho cada 250 ms)
+        now = time.time()
+        if current > 0 and (completed or now - self._eta_time >= 0.25):
+            elapsed = now - self.start_time
+            eta = (elapsed / current) * (self.total - current)
+            self._eta_str = f"ETA: {int(eta)}s"
+            self._eta_time = now
         
-        if current >= self.total:
-            print()  # Nueva línea al completar
+        # Imprimir barra (con nueva línea al completar) en una sola escritura
+        tail = self._TAIL_TEMPLATE.format(
+            percent, self._eta_str,
+            f" | {message[:30]}" if message else "",
+            "\n" if completed else ""
+        )
+        sys.stdout.write(self._line_prefix + self._bars[filled_length] + tail)
+        sys.stdout.flush()
     
     def finish(self, message: str = ""):
         """Finaliza la barra de progreso"""
         self.update(self.total, message)
 
+@functools.lru_cache(maxsize=32)
+def _table_layout(headers: Tuple[str, ...], cw: Tuple[int, ...]) -> Tuple[str, str, str]:
+    """Encabezado, separador y formato de fila para unos anchos dados"""
+    # Línea de encabezado
+    header_line = "| " + " | ".join(
+        [header.ljust(width) for header, width in zip(headers, cw)]
+    ) + " |"
+    
+    # Línea separadora
+    separator = "+" + "+".join(["-" * (width + 2) for width in cw]) + "+"
+    
+    # Formato de datos: rellena y recorta a cada ancho
+    row_format = "| " + " | ".join(
+        [f"{{:<{width}.{width}}}" for width in cw]
+    ) + " |"
+    
+    return header_line, separator, row_format
+
 class TableFormatter:
     """Formateador de tablas para CLI"""
     
@@ -128,130 +235,216 @@ class TableFormatter:
         if not data:
             return "No hay datos para mostrar"
         
-        # Calcular anchos de columna
-        col_widths = {}
-        for header in headers:
-            col_widths[header] = len(header)
+        # Convertir cada columna a texto una sola vez
+        columns = [[str(row.get(header, '')) for row in data] for header in headers]
         
-        for row in data:
-            for header in headers:
-                value = str(row.get(header, ''))
-                col_widths[header] = max(col_widths[header], len(value))
+        return TableFormatter.format_columns(columns, headers, max_width)
+    
+    @staticmethod
+    def format_columns(columns: List[List[str]], headers: List[str],
+                       max_width: int = 80) -> str:
+        """
+        Formatea en tabla datos organizados por columnas
         
-        # Ajustar anchos si exceden el máximo
-        total_width = sum(col_widths.values()) + len(headers) * 3
-        if total_width > max_width:
-            # Reducir proporcionalmente
-            factor = (max_width - len(headers) * 3) / sum(col_widths.values())
-            for header in headers:
-                col_widths[header] = max(8, int(col_widths[header] * factor))
+        Args:
+            columns: Una lista de textos por cada encabezado, en su orden
+            headers: Encabezados de la tabla
+            max_width: Ancho máximo de la tabla
+        """
+        if not columns or not columns[0]:
+            return "No hay datos para mostrar"
         
-        # Crear tabla
-        lines = []
+        # Calcular anchos de columna (lista posicional, alineada con headers)
+        cw = [max(len(header), max(map(len, column)))
+              for header, column in zip(headers, columns)]
         
-        # Línea de encabezado
-        header_line = "| " + " | ".join(
-            header.ljust(col_widths[header]) for header in headers
-        ) + " |"
-        lines.append(header_line)
+        # Ajustar anchos si exceden el máximo
+        total = sum(cw)
+        if total + len(headers) * 3 > max_width:
+            # Reducir proporcionalmente
+            factor = (max_width - len(headers) * 3) / total
+            cw = [max(8, int(width * factor)) for width in cw]
         
-        # Línea separadora
-        separator = "+" + "+".join(
-            "-" * (col_widths[header] + 2) for header in headers
-        ) + "+"
-        lines.append(separator)
+        # La disposición se reutiliza mientras no cambien los anchos
+        # (refrescos sucesivos de la misma tabla)
+        header_line, separator, row_format = _table_layout(tuple(headers), tuple(cw))
         
-        # Líneas de datos
-        for row in data:
-            row_line = "| " + " | ".join(
-                str(row.get(header, '')).ljust(col_widths[header])[:col_widths[header]]
-                for header in headers
-            ) + " |"
-            lines.append(row_line)
+        lines = [header_line, separator]
+        lines.extend([row_format.format(*cells) for cells in zip(*columns)])
         
         return "\n".join(lines)
 
 class StatusDisplay:
     """Display de estado para CLI"""
     
+    # Color de cada estado de métrica
+    _STATUS_COLOR = {
+        "good": Colors.SUCCESS,
+        "warning": Colors.WARNING,
+        "critical": Colors.ERROR,
+        "normal": Colors.WHITE
+    }
+    
+    _HEADER_SEP = '=' * 60
+    
     def __init__(self, use_colors: bool = True):
         self.use_colors = use_colors and Colors.is_supported()
+        # Se enlaza una vez la variante con o sin color; los print_* no ramifican
+        self._paint = Colors.colored if self.use_colors else _plain
+        # Apertura (color + icono) y cierre de los mensajes de una línea
+        on = self.use_colors
+        self._prefix_success = f"{Colors.SUCCESS if on else ''}✓ "
+        self._prefix_error = f"{Colors.ERROR if on else ''}✗ "
+        self._prefix_warning = f"{Colors.WARNING if on else ''}⚠ "
+        self._prefix_info = f"{Colors.INFO if on else ''}ℹ "
+        self._suffix = f"{Colors.RESET if on else ''}\n"
+        # Líneas fijas del encabezado, ya coloreadas
+        self._header_top = self._paint("\n" + self._HEADER_SEP, Colors.HEADER) + "\n"
+        self._header_bottom = self._paint(self._HEADER_SEP, Colors.HEADER) + "\n"
         self.spinner_chars = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
         self.spinner_index = 0
+        # Siguiente índice de cada posición (evita el módulo en cada fotograma)
+        self._spinner_next = list(range(1, len(self.spinner_chars))) + [0]
+        # Salida alternativa por hilo (la fija buffered); sin ella se usa sys.stdout
+        self._local = threading.local()
+    
+    @property
+    def _out(self):
+        """Flujo en el que escribe el display desde el hilo actual"""
+        return getattr(self._local, 'out', None) or sys.stdout
     
     def print_header(self, text: str):
         """Imprime encabezado"""
-        if self.use_colors:
-            print(Colors.colored(f"\n{'='*60}", Colors.HEADER))
-            print(Colors.colored(f" {text.center(58)} ", Colors.HEADER + Colors.BOLD))
-            print(Colors.colored(f"{'='*60}", Colors.HEADER))
-        else:
-            print(f"\n{'='*60}")
-            print(f" {text.center(58)} ")
-            print(f"{'='*60}")
+        # Una sola escritura para las tres líneas
+        self._out.write(
+            self._header_top +
+            self._paint(_centered(text), Colors.HEADER_BOLD) + "\n" +
+            self._header_bottom
+        )
     
     def print_section(self, text: str):
         """Imprime sección"""
-        if self.use_colors:
-            print(Colors.colored(f"\n▶ {text}", Colors.INFO + Colors.BOLD))
-            print(Colors.colored("-" * (len(text) + 3), Colors.INFO))
-        else:
-            print(f"\n▶ {text}")
-            print("-" * (len(text) + 3))
+        paint = self._paint
+        self._out.write(
+            paint(f"\n▶ {text}", Colors.INFO_BOLD) + "\n" +
+            paint("-" * (len(text) + 3), Colors.INFO) + "\n"
+        )
     
     def print_success(self, text: str):
         """Imprime mensaje de éxito"""
-        if self.use_colors:
-            print(Colors.colored(f"✓ {text}", Colors.SUCCESS))
-        else:
-            print(f"✓ {text}")
+        self._out.write(f"{self._prefix_success}{text}{self._suffix}")
     
     def print_error(self, text: str):
         """Imprime mensaje de error"""
-        if self.use_colors:
-            print(Colors.colored(f"✗ {text}", Colors.ERROR))
-        else:
-            print(f"✗ {text}")
+        self._out.write(f"{self._prefix_error}{text}{self._suffix}")
     
     def print_warning(self, text: str):
         """Imprime mensaje de advertencia"""
-        if self.use_colors:
-            print(Colors.colored(f"⚠ {text}", Colors.WARNING))
-        else:
-            print(f"⚠ {text}")
+        self._out.write(f"{self._prefix_warning}{text}{self._suffix}")
     
     def print_info(self, text: str):
         """Imprime mensaje informativo"""
-        if self.use_colors:
-            print(Colors.colored(f"ℹ {text}", Colors.INFO))
-        else:
-            print(f"ℹ {text}")
+        self._out.write(f"{self._prefix_info}{text}{self._suffix}")
     
     def print_metric(self, label: str, value: str, status: str = "normal"):
         """Imprime métrica con estado"""
-        color_map = {
-            "good": Colors.SUCCESS,
-            "warning": Colors.WARNING,
-            "critical": Colors.ERROR,
-            "normal": Colors.WHITE
-        }
+        color = self._STATUS_COLOR.get(status, Colors.WHITE)
         
-        color = color_map.get(status, Colors.WHITE)
-        
-        if self.use_colors:
-            print(f"  {label}: {Colors.colored(value, color)}")
-        else:
-            print(f"  {label}: {value}")
+        self._out.write(f"  {label}: {self._paint(value, color)}\n")
+    
+    def print_line(self, text: str = ""):
+        """Imprime una línea de texto sin formato"""
+        self._out.write(f"{text}\n")
+    
+    @contextlib.contextmanager
+    def buffered(self):
+        """Acumula en memoria lo que escribe el display en este hilo y lo vuelca al salir"""
+        local = self._local
+        previous = getattr(local, 'out', None)
+        buffer = io.StringIO()
+        local.out = buffer
+        try:
+            yield
+        finally:
+            local.out = previous
+            (previous or sys.stdout).write(buffer.getvalue())
     
     def get_spinner(self) -> str:
         """Obtiene siguiente carácter del spinner"""
-        char = self.spinner_chars[self.spinner_index]
-        self.spinner_index = (self.spinner_index + 1) % len(self.spinner_chars)
-        return char
+        i = self.spinner_index
+        self.spinner_index = self._spinner_next[i]
+        return self.spinner_chars[i]
+
+# Ayuda del modo interactivo
+_INTERACTIVE_HELP = """
+Comandos disponibles en modo interactivo:
+
+  help              - Mostrar esta ayuda
+  status            - Estado del sistema
+  quick             - Verificación rápida
+  screenshot        - Captura de pantalla
+  export [formato]  - Exportar reporte (json/html/text)
+  clear             - Limpiar pantalla
+  exit, quit, q     - Salir del modo interactivo
+
+También puede usar cualquier comando normal:
+  scan --detailed
+  monitor --mode continuous
+  temperature --duration 30
+  etc.
+        """
 
 class SystemMonitorCLI:
     """Interfaz de línea de comandos para el sistema de monitoreo"""
     
+    # Constructores de subparsers por comando (en orden de ayuda)
+    _SUBPARSER_BUILDERS = {
+        'quick': '_add_quick_parser',
+        'scan': '_add_scan_parser',
+        'monitor': '_add_monitor_parser',
+        'temperature': '_add_temperature_parser',
+        'cpu': '_add_cpu_parser',
+        'memory': '_add_memory_parser',
+        'disk': '_add_disk_parser',
+        'security': '_add_security_parser',
+        'services': '_add_services_parser',
+        'startup': '_add_startup_parser',
+        'screenshot': '_add_screenshot_parser',
+        'export': '_add_export_parser',
+        'status': '_add_status_parser',
+        'interactive': '_add_interactive_parser',
+        'config': '_add_config_parser'
+    }
+    
+    # Manejador de cada comando (nombre del método, resuelto con getattr)
+    _COMMAND_MAP = {
+        'quick': '_cmd_quick',
+        'scan': '_cmd_scan',
+        'monitor': '_cmd_monitor',
+        'temperature': '_cmd_temperature',
+        'cpu': '_cmd_cpu',
+        'memory': '_cmd_memory',
+        'disk': '_cmd_disk',
+        'security': '_cmd_security',
+        'services': '_cmd_services',
+        'startup': '_cmd_startup',
+        'screenshot': '_cmd_screenshot',
+        'export': '_cmd_export',
+        'status': '_cmd_status',
+        'interactive': '_cmd_interactive',
+        'config': '_cmd_config'
+    }
+    
+    # Comandos propios del modo interactivo (nombre del manejador)
+    _INTERACTIVE_COMMANDS = {
+        'help': '_show_interactive_help',
+        'status': '_interactive_status',
+        'quick': '_interactive_quick',
+        'screenshot': '_interactive_screenshot',
+        'clear': '_interactive_clear',
+        'export': '_interactive_export'
+    }
+    
     def __init__(self):
         """Inicializa la CLI"""
         self.version = SystemConfig.APP_VERSION
@@ -271,6 +464,7 @@ class SystemMonitorCLI:
         
         # Display
         self.display = StatusDisplay(self.use_colors)
+        _use_block_buffered_stdout()
         
         # Control de señales
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -285,12 +479,18 @@ class SystemMonitorCLI:
         if signum in [signal.SIGINT, signal.SIGTERM]:
             self.display.print_warning("\nSeñal de interrupción recibida. Cerrando...")
             self.running = False
+            sys.stdout.flush()
             if self.monitor_system:
                 self.monitor_system.shutdown_system()
             sys.exit(0)
     
-    def create_parser(self) -> argparse.ArgumentParser:
-        """Crea el parser de argumentos"""
+    def create_parser(self, command: Optional[str] = None) -> argparse.ArgumentParser:
+        """
+        Crea el parser de argumentos
+        
+        Args:
+            command: Si se indica, solo se construye el subparser de ese comando
+        """
         parser = argparse.ArgumentParser(
             prog='sysmonitor',
             description=f'Sistema de Monitoreo de PC v{self.version} por {self.author}',
@@ -319,12 +519,42 @@ class SystemMonitorCLI:
         # Subcomandos
         subparsers = parser.add_subparsers(dest='command', help='Comandos disponibles')
         
-        # Comando quick
+        if command in self._SUBPARSER_BUILDERS:
+            getattr(self, self._SUBPARSER_BUILDERS[command])(subparsers)
+        else:
+            for builder_name in self._SUBPARSER_BUILDERS.values():
+                getattr(self, builder_name)(subparsers)
+        
+        return parser
+    
+    def _peek_command(self, args: Optional[List[str]]) -> Optional[str]:
+        """
+        Localiza el subcomando en los argumentos sin construir el parser
+        
+        Returns:
+            Nombre del comando, o None si no se reconoce o se pide ayuda general
+        """
+        args = sys.argv[1:] if args is None else args
+        skip_value = False
+        for arg in args:
+            if skip_value:
+                skip_value = False
+            elif arg in ('-h', '--help'):
+                return None
+            elif arg in ('-o', '--output', '--format'):
+                skip_value = True
+            elif not arg.startswith('-'):
+                return arg if arg in self._SUBPARSER_BUILDERS else None
+        return None
+    
+    def _add_quick_parser(self, subparsers):
+        """Añade el subcomando quick"""
         quick_parser = subparsers.add_parser('quick', 
                                            help='Verificación rápida del sistema')
         quick_parser.add_argument('--export', help='Exportar resultado a archivo')
-        
-        # Comando scan
+    
+    def _add_scan_parser(self, subparsers):
+        """Añade el subcomando scan"""
         scan_parser = subparsers.add_parser('scan',
                                           help='Escaneo del sistema')
         scan_parser.add_argument('--detailed', action='store_true',
@@ -336,8 +566,9 @@ class SystemMonitorCLI:
         scan_parser.add_argument('--network', action='store_true',
                                help='Incluir información de red')
         scan_parser.add_argument('--export', help='Exportar resultado a archivo')
-        
-        # Comando monitor
+    
+    def _add_monitor_parser(self, subparsers):
+        """Añade el subcomando monitor"""
         monitor_parser = subparsers.add_parser('monitor',
                                              help='Monitoreo del sistema')
         monitor_parser.add_argument('--mode', 
@@ -350,8 +581,9 @@ class SystemMonitorCLI:
         monitor_parser.add_argument('--interval', type=int, default=5,
                                   help='Intervalo de muestreo en segundos')
         monitor_parser.add_argument('--export', help='Exportar resultado a archivo')
-        
-        # Comando temperature
+    
+    def _add_temperature_parser(self, subparsers):
+        """Añade el subcomando temperature"""
         temp_parser = subparsers.add_parser('temperature',
                                           help='Monitoreo de temperatura')
         temp_parser.add_argument('--duration', type=int, default=60,
@@ -360,24 +592,27 @@ class SystemMonitorCLI:
                                help='Umbral de temperatura crítica')
         temp_parser.add_argument('--continuous', action='store_true',
                                help='Monitoreo continuo')
-        
-        # Comando cpu
+    
+    def _add_cpu_parser(self, subparsers):
+        """Añade el subcomando cpu"""
         cpu_parser = subparsers.add_parser('cpu',
                                          help='Monitoreo de CPU')
         cpu_parser.add_argument('--duration', type=int, default=60,
                               help='Duración del monitoreo en segundos')
         cpu_parser.add_argument('--show-cores', action='store_true',
                               help='Mostrar uso por núcleo')
-        
-        # Comando memory
+    
+    def _add_memory_parser(self, subparsers):
+        """Añade el subcomando memory"""
         memory_parser = subparsers.add_parser('memory',
                                             help='Monitoreo de memoria')
         memory_parser.add_argument('--duration', type=int, default=60,
                                  help='Duración del monitoreo en segundos')
         memory_parser.add_argument('--show-processes', action='store_true',
                                  help='Mostrar procesos con mayor uso')
-        
-        # Comando disk
+    
+    def _add_disk_parser(self, subparsers):
+        """Añade el subcomando disk"""
         disk_parser = subparsers.add_parser('disk',
                                           help='Análisis de discos')
         disk_parser.add_argument('--health', action='store_true',
@@ -386,8 +621,9 @@ class SystemMonitorCLI:
                                help='Análisis de rendimiento')
         disk_parser.add_argument('--cleanup', action='store_true',
                                help='Análisis de archivos temporales')
-        
-        # Comando security
+    
+    def _add_security_parser(self, subparsers):
+        """Añade el subcomando security"""
         security_parser = subparsers.add_parser('security',
                                               help='Análisis de seguridad')
         security_parser.add_argument('--antivirus', action='store_true',
@@ -396,16 +632,18 @@ class SystemMonitorCLI:
                                    help='Verificar Windows Update')
         security_parser.add_argument('--firewall', action='store_true',
                                    help='Verificar firewall')
-        
-        # Comando services
+    
+    def _add_services_parser(self, subparsers):
+        """Añade el subcomando services"""
         services_parser = subparsers.add_parser('services',
                                               help='Análisis de servicios')
         services_parser.add_argument('--running-only', action='store_true',
                                    help='Solo servicios en ejecución')
         services_parser.add_argument('--critical-only', action='store_true',
                                    help='Solo servicios críticos')
-        
-        # Comando startup
+    
+    def _add_startup_parser(self, subparsers):
+        """Añade el subcomando startup"""
         startup_parser = subparsers.add_parser('startup',
                                              help='Análisis de programas de inicio')
         startup_parser.add_argument('--registry', action='store_true',
@@ -414,47 +652,51 @@ class SystemMonitorCLI:
                                   help='Incluir carpetas de inicio')
         startup_parser.add_argument('--tasks', action='store_true',
                                   help='Incluir tareas programadas')
-        
-        # Comando screenshot
+    
+    def _add_screenshot_parser(self, subparsers):
+        """Añade el subcomando screenshot"""
         screenshot_parser = subparsers.add_parser('screenshot',
                                                 help='Captura de pantalla')
         screenshot_parser.add_argument('--all-monitors', action='store_true',
                                      help='Capturar todos los monitores')
         screenshot_parser.add_argument('--output-dir', 
                                      help='Directorio de salida')
-        
-        # Comando export
+    
+    def _add_export_parser(self, subparsers):
+        """Añade el subcomando export"""
         export_parser = subparsers.add_parser('export',
                                             help='Exportar reportes')
         export_parser.add_argument('--session-id', help='ID de sesión a exportar')
         export_parser.add_argument('--format', choices=['json', 'html', 'text'],
                                  default='json', help='Formato de exportación')
         export_parser.add_argument('--output-dir', help='Directorio de salida')
-        
-        # Comando status
+    
+    def _add_status_parser(self, subparsers):
+        """Añade el subcomando status"""
         status_parser = subparsers.add_parser('status',
                                             help='Estado del sistema de monitoreo')
         status_parser.add_argument('--detailed', action='store_true',
                                  help='Estado detallado')
-        
-        # Comando interactive
-        interactive_parser = subparsers.add_parser('interactive',
-                                                 help='Modo interactivo')
-        
-        # Comando config
+    
+    def _add_interactive_parser(self, subparsers):
+        """Añade el subcomando interactive"""
+        subparsers.add_parser('interactive',
+                            help='Modo interactivo')
+    
+    def _add_config_parser(self, subparsers):
+        """Añade el subcomando config"""
         config_parser = subparsers.add_parser('config',
                                             help='Configuración del sistema')
         config_parser.add_argument('--show', action='store_true',
                                  help='Mostrar configuración actual')
         config_parser.add_argument('--reset', action='store_true',
                                  help='Restaurar configuración por defecto')
-        
-        return parser
     
     def run(self, args: List[str] = None) -> int:
         """Ejecuta la CLI"""
         try:
-            parser = self.create_parser()
+            # Construir solo el subparser del comando solicitado
+            parser = self.create_parser(self._peek_command(args))
             parsed_args = parser.parse_args(args)
             
             # Configurar opciones globales
@@ -483,9 +725,10 @@ class SystemMonitorCLI:
         except Exception as e:
             self.display.print_error(f"Error crítico: {str(e)}")
             if self.verbose:
-                import traceback
-                traceback.print_exc()
+                _get_tb().print_exc()
             return 1
+        finally:
+            sys.stdout.flush()
     
     def _show_banner(self):
         """Muestra el banner de la aplicación"""
@@ -505,26 +748,9 @@ class SystemMonitorCLI:
     def _execute_command(self, args) -> int:
         """Ejecuta el comando especificado"""
         try:
-            command_map = {
-                'quick': self._cmd_quick,
-                'scan': self._cmd_scan,
-                'monitor': self._cmd_monitor,
-                'temperature': self._cmd_temperature,
-                'cpu': self._cmd_cpu,
-                'memory': self._cmd_memory,
-                'disk': self._cmd_disk,
-                'security': self._cmd_security,
-                'services': self._cmd_services,
-                'startup': self._cmd_startup,
-                'screenshot': self._cmd_screenshot,
-                'export': self._cmd_export,
-                'status': self._cmd_status,
-                'interactive': self._cmd_interactive,
-                'config': self._cmd_config
-            }
-            
-            if args.command in command_map:
-                return command_map[args.command](args)
+            handler = self._COMMAND_MAP.get(args.command)
+            if handler is not None:
+                return getattr(self, handler)(args)
             else:
                 self.display.print_error(f"Comando desconocido: {args.command}")
                 return 1
@@ -532,8 +758,7 @@ class SystemMonitorCLI:
         except Exception as e:
             self.display.print_error(f"Error ejecutando comando: {str(e)}")
             if self.verbose:
-                import traceback
-                traceback.print_exc()
+                _get_tb().print_exc()
             return 1
     
     def _initialize_monitor(self) -> bool:
@@ -543,6 +768,7 @@ class SystemMonitorCLI:
         
         if not self.quiet:
             self.display.print_info("Inicializando sistema de monitoreo...")
+            sys.stdout.flush()
         
         try:
             self.monitor_system = create_system_monitor()
@@ -790,19 +1016,23 @@ class SystemMonitorCLI:
             if not self._initialize_monitor():
                 return 1
             
-            results = []
+            run_all = not any([args.antivirus, args.updates, args.firewall])
+            tasks = []
+            titles = []
             
-            if args.antivirus or not any([args.antivirus, args.updates, args.firewall]):
-                self.display.print_section("Verificando Antivirus")
-                result = self._execute_task_with_progress('AntivirusStatusTask', {})
-                if result:
-                    results.append(('antivirus', result))
+            if args.antivirus or run_all:
+                tasks.append(('antivirus', 'AntivirusStatusTask', {}))
+                titles.append("Antivirus")
             
-            if args.updates or not any([args.antivirus, args.updates, args.firewall]):
-                self.display.print_section("Verificando Windows Update")
-                result = self._execute_task_with_progress('WindowsUpdateTask', {})
-                if result:
-                    results.append(('updates', result))
+            if args.updates or run_all:
+                tasks.append(('updates', 'WindowsUpdateTask', {}))
+                titles.append("Windows Update")
+            
+            # Las verificaciones son independientes: se ejecutan a la vez
+            results = []
+            if tasks:
+                self.display.print_section(f"Verificando {' y '.join(titles)}")
+                results = self._execute_tasks_concurrently(tasks)
             
             # Mostrar resultados
             for result_type, result_data in results:
@@ -945,9 +1175,13 @@ class SystemMonitorCLI:
             
             self.display.print_info("Escriba 'help' para ver comandos disponibles o 'exit' para salir")
             
+            # El prompt no cambia durante la sesión
+            prompt = Colors.colored('sysmonitor>', Colors.CYAN) if self.use_colors else 'sysmonitor>'
+            prompt = f"\n{prompt} "
+            
             while self.running and self.interactive_mode:
                 try:
-                    user_input = input(f"\n{Colors.colored('sysmonitor>', Colors.CYAN) if self.use_colors else 'sysmonitor>'} ").strip()
+                    user_input = input(prompt).strip()
                     
                     if not user_input:
                         continue
@@ -997,69 +1231,149 @@ class SystemMonitorCLI:
             
             task_id = self.monitor_system.execute_custom_task(task_name, task_config)
             
-            # Esperar resultado con updates de progreso
-            start_time = time.time()
+            # Esperar el resultado sobre el Future de la tarea; el timeout de
+            # cada espera solo marca el ritmo de actualización de la barra
+            waiter = self.monitor_system.get_task_future(task_id)
+            start_time = time.monotonic()
+            deadline = start_time + 300  # Timeout después de 5 minutos
             last_progress = 0
+            result = None
             
-            while True:
-                result = self.monitor_system.get_task_result(task_id)
-                
-                if result:
-                    if not self.quiet:
-                        progress.finish("Completado")
-                    
-                    if result.get('status') == 'completed':
-                        return result.get('data')
-                    else:
-                        self.display.print_error(f"Tarea falló: {result.get('error', 'Error desconocido')}")
+            while waiter is not None:
+                try:
+                    remaining = max(0.0, deadline - time.monotonic())
+                    result = waiter.result(timeout=min(0.5, remaining)).to_dict()
+                    break
+                except FutureTimeoutError:
+                    elapsed = time.monotonic() - start_time
+                    if elapsed >= 300:
+                        if not self.quiet:
+                            progress.finish("Timeout")
+                        self.display.print_error("Timeout esperando resultado de tarea")
                         return None
-                
-                # Actualizar progreso estimado
-                elapsed = time.time() - start_time
-                estimated_progress = min(90, (elapsed / 30) * 100)  # Estimar 30s máximo
-                
-                if not self.quiet and estimated_progress > last_progress + 5:
-                    progress.update(int(estimated_progress), "En progreso...")
-                    last_progress = estimated_progress
-                
-                time.sleep(1)
-                
-                # Timeout después de 5 minutos
-                if elapsed > 300:
-                    if not self.quiet:
-                        progress.finish("Timeout")
-                    self.display.print_error("Timeout esperando resultado de tarea")
-                    return None
+                    
+                    # Actualizar progreso estimado
+                    estimated_progress = min(90, (elapsed / 30) * 100)  # Estimar 30s máximo
+                    
+                    if not self.quiet and estimated_progress > last_progress + 5:
+                        progress.update(int(estimated_progress), "En progreso...")
+                        last_progress = estimated_progress
+                except CancelledError:
+                    break
+            
+            if result is None:
+                # Tarea cancelada o ya fuera del historial de Futures
+                result = self.monitor_system.get_task_result(task_id) or {}
+            
+            if not self.quiet:
+                progress.finish("Completado")
+            
+            if result.get('status') == 'completed':
+                return result.get('data')
+            else:
+                self.display.print_error(f"Tarea falló: {result.get('error', 'Error desconocido')}")
+                return None
                     
         except Exception as e:
             self.display.print_error(f"Error ejecutando tarea: {str(e)}")
             return None
     
+    def _execute_tasks_concurrently(self, tasks: List[Tuple[str, str, Dict[str, Any]]]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Ejecuta varias tareas independientes a la vez mostrando progreso
+        
+        Args:
+            tasks: Lista de (etiqueta, nombre de tarea, configuración)
+            
+        Returns:
+            Lista de (etiqueta, datos) de las tareas completadas, en el
+            orden de entrada
+        """
+        try:
+            if not self.quiet:
+                progress = ProgressBar(len(tasks), prefix="Ejecutando tareas")
+                progress.update(0, "Iniciando...")
+            
+            # Programar todas antes de esperar a ninguna
+            submitted = []
+            for label, task_name, task_config in tasks:
+                task_id = self.monitor_system.execute_custom_task(task_name, task_config)
+                submitted.append((label, task_id, self.monitor_system.get_task_future(task_id)))
+            
+            # Avanzar la barra a medida que terminan (timeout global de 5 minutos)
+            waiters = [waiter for _, _, waiter in submitted if waiter is not None]
+            finished = len(submitted) - len(waiters)
+            try:
+                for _ in as_completed(waiters, timeout=300):
+                    finished += 1
+                    if not self.quiet and finished < len(submitted):
+                        progress.update(finished, "En progreso...")
+            except FutureTimeoutError:
+                if not self.quiet:
+                    progress.finish("Timeout")
+                self.display.print_error("Timeout esperando resultado de tareas")
+            else:
+                if not self.quiet:
+                    progress.finish("Completado")
+            
+            results = []
+            for label, task_id, waiter in submitted:
+                if waiter is not None and waiter.done() and not waiter.cancelled():
+                    result = waiter.result().to_dict()
+                else:
+                    result = self.monitor_system.get_task_result(task_id) or {}
+                
+                if result.get('status') == 'completed':
+                    if result.get('data'):
+                        results.append((label, result['data']))
+                elif waiter is None or waiter.done():
+                    self.display.print_error(f"Tarea {label} falló: {result.get('error', 'Error desconocido')}")
+            
+            return results
+            
+        except Exception as e:
+            self.display.print_error(f"Error ejecutando tareas: {str(e)}")
+            return []
+    
     def _monitor_session_progress(self, max_duration: int):
         """Monitorea el progreso de una sesión"""
         try:
             if not self.quiet:
                 progress = ProgressBar(max_duration, prefix="Monitoreando")
             
-            start_time = time.time()
+            # El sistema avisa al terminar cada tarea y al cerrar la sesión;
+            # así no se pide el estado completo en cada vuelta
+            session = {'tasks_completed': 0}
+            finished = threading.Event()
             
-            while True:
-                elapsed = time.time() - start_time
-                
-                if elapsed >= max_duration:
-                    break
-                
+            def on_status(summary: Dict[str, Any]):
+                session['tasks_completed'] = summary.get('tasks_completed', 0)
+                if not summary.get('active_monitoring', False):
+                    finished.set()
+            
+            # Suscribirse antes de consultar el estado para no perder un cierre
+            self.monitor_system.subscribe_status(on_status)
+            try:
                 status = self.monitor_system.get_system_status()
-                
                 if not status.get('active_monitoring', False):
-                    break
+                    finished.set()
                 
-                if not self.quiet:
-                    session_info = status.get('current_session', {})
-                    message = f"Tareas: {session_info.get('tasks_completed', 0)} completadas"
-                    progress.update(int(elapsed), message)
+                start_time = time.monotonic()
                 
-                time.sleep(2)
+                while not finished.is_set():
+                    elapsed = time.monotonic() - start_time
+                    
+                    if elapsed >= max_duration:
+                        break
+                    
+                    if not self.quiet:
+                        message = f"Tareas: {session['tasks_completed']} completadas"
+                        progress.update(int(elapsed), message)
+                    
+                    # El intervalo solo avanza la barra; el fin llega por evento
+                    finished.wait(min(2, max_duration - elapsed))
+            finally:
+                self.monitor_system.unsubscribe_status(on_status)
             
             if not self.quiet:
                 progress.finish("Monitoreo completado")
@@ -1072,6 +1386,16 @@ class SystemMonitorCLI:
         try:
             self.display.print_info("Iniciando monitoreo continuo de temperatura (Ctrl+C para detener)")
             
+            # Plantillas por nivel de temperatura (normal, alta, crítica)
+            if self.use_colors:
+                temp_formats = tuple(
+                    f"{color}{{}}: {{:.1f}}°C{Colors.RESET}"
+                    for color in (Colors.SUCCESS, Colors.WARNING, Colors.ERROR)
+                )
+            else:
+                temp_formats = ("{}: {:.1f}°C",) * 3
+            critical_temp = task_config['critical_temp_threshold']
+            
             while self.running:
                 # Ejecutar monitoreo corto
                 task_config['monitoring_duration'] = 10
@@ -1084,23 +1408,17 @@ class SystemMonitorCLI:
                         last_sample = samples[-1]
                         timestamp = last_sample.get('timestamp', 'Unknown')
                         
-                        print(f"\r{timestamp} | ", end="")
+                        # Componer la línea completa y emitirla en una sola escritura
+                        parts = [f"\r{timestamp} | "]
                         
                         temps = last_sample.get('temperatures', {})
                         for source, temp_data in temps.items():
                             temp = temp_data.get('current', 0)
-                            color = Colors.SUCCESS
-                            if temp > task_config['critical_temp_threshold']:
-                                color = Colors.ERROR
-                            elif temp > 70:
-                                color = Colors.WARNING
-                            
-                            temp_str = f"{source}: {temp:.1f}°C"
-                            if self.use_colors:
-                                temp_str = Colors.colored(temp_str, color)
-                            
-                            print(f"{temp_str} | ", end="")
+                            level = 2 if temp > critical_temp else int(temp > 70)
+                            parts.append(temp_formats[level].format(source, temp))
+                            parts.append(" | ")
                         
+                        sys.stdout.write(''.join(parts))
                         sys.stdout.flush()
                 
                 time.sleep(5)
@@ -1111,34 +1429,20 @@ class SystemMonitorCLI:
     def _process_interactive_command(self, command: str):
         """Procesa un comando en modo interactivo"""
         try:
-            # Parsear comando
-            args = shlex.split(command)
+            # Parsear comando: str.split basta sin comillas ni escapes;
+            # shlex solo se carga cuando hacen falta
+            if '"' in command or "'" in command or '\\' in command:
+                import shlex
+                args = shlex.split(command)
+            else:
+                args = command.split()
             
             if not args:
                 return
             
-            cmd = args[0].lower()
-            
-            if cmd == 'help':
-                self._show_interactive_help()
-            elif cmd == 'status':
-                status = self.monitor_system.get_system_status()
-                self._display_system_status(status, False)
-            elif cmd == 'quick':
-                result = run_quick_system_scan()
-                self._display_quick_results(result)
-            elif cmd == 'screenshot':
-                result = self.monitor_system.take_screenshot(True)
-                if result:
-                    self.display.print_success("Captura realizada")
-            elif cmd == 'clear':
-                os.system('cls' if os.name == 'nt' else 'clear')
-            elif cmd.startswith('export'):
-                if len(args) > 1:
-                    format_type = args[1] if args[1] in ['json', 'html', 'text'] else 'json'
-                    file_path = self.monitor_system.export_session_report(None, format_type)
-                    if file_path:
-                        self.display.print_success(f"Reporte exportado: {file_path}")
+            handler = self._INTERACTIVE_COMMANDS.get(args[0].lower())
+            if handler is not None:
+                getattr(self, handler)(args)
             else:
                 # Intentar ejecutar como comando completo
                 try:
@@ -1151,29 +1455,46 @@ class SystemMonitorCLI:
         except Exception as e:
             self.display.print_error(f"Error procesando comando: {str(e)}")
     
-    def _show_interactive_help(self):
+    def _interactive_status(self, args: List[str]):
+        """Comando interactivo 'status'"""
+        status = self.monitor_system.get_system_status()
+        self._display_system_status(status, False)
+    
+    def _interactive_quick(self, args: List[str]):
+        """Comando interactivo 'quick'"""
+        result = run_quick_system_scan()
+        self._display_quick_results(result)
+    
+    def _interactive_screenshot(self, args: List[str]):
+        """Comando interactivo 'screenshot'"""
+        result = self.monitor_system.take_screenshot(True)
+        if result:
+            self.display.print_success("Captura realizada")
+    
+    def _interactive_clear(self, args: List[str]):
+        """Comando interactivo 'clear'"""
+        if self.use_colors:
+            # El terminal ya interpreta ANSI: borrar sin lanzar un shell
+            sys.stdout.write('\x1b[2J\x1b[H')
+            sys.stdout.flush()
+        else:
+            os.system('cls' if os.name == 'nt' else 'clear')
+    
+    def _interactive_export(self, args: List[str]):
+        """Comando interactivo 'export [formato]'"""
+        if len(args) > 1:
+            format_type = args[1] if args[1] in ['json', 'html', 'text'] else 'json'
+            file_path = self.monitor_system.export_session_report(None, format_type)
+            if file_path:
+                self.display.print_success(f"Reporte exportado: {file_path}")
+    
+    def _show_interactive_help(self, args: Optional[List[str]] = None):
         """Muestra ayuda del modo interactivo"""
-        help_text = """
-Comandos disponibles en modo interactivo:
-
-  help              - Mostrar esta ayuda
-  status            - Estado del sistema
-  quick             - Verificación rápida
-  screenshot        - Captura de pantalla
-  export [formato]  - Exportar reporte (json/html/text)
-  clear             - Limpiar pantalla
-  exit, quit, q     - Salir del modo interactivo
-
-También puede usar cualquier comando normal:
-  scan --detailed
-  monitor --mode continuous
-  temperature --duration 30
-  etc.
-        """
-        print(help_text)
+        print(_INTERACTIVE_HELP)
     
     # Métodos de visualización de resultados
     
+    @_buffered_output
     def _display_quick_results(self, result: Dict[str, Any]):
         """Muestra resultados de verificación rápida"""
         try:
@@ -1193,14 +1514,14 @@ También puede usar cualquier comando normal:
             # Métricas
             metrics = result.get('metrics', {})
             if metrics:
-                print("\nMétricas del sistema:")
+                self.display.print_line("\nMétricas del sistema:")
                 for key, value in metrics.items():
                     self.display.print_metric(key.replace('_', ' ').title(), str(value))
             
             # Alertas
             alerts = result.get('alerts', [])
             if alerts:
-                print(f"\nAlertas encontradas ({len(alerts)}):")
+                self.display.print_line(f"\nAlertas encontradas ({len(alerts)}):")
                 for alert in alerts:
                     level = alert.get('level', 'INFO')
                     message = alert.get('message', 'Sin mensaje')
@@ -1215,13 +1536,14 @@ También puede usar cualquier comando normal:
             # Recomendaciones
             recommendations = result.get('recommendations', [])
             if recommendations:
-                print(f"\nRecomendaciones:")
+                self.display.print_line(f"\nRecomendaciones:")
                 for rec in recommendations:
                     self.display.print_info(f"  • {rec}")
                     
         except Exception as e:
             self.display.print_error(f"Error mostrando resultados rápidos: {str(e)}")
     
+    @_buffered_output
     def _display_scan_results(self, result: Dict[str, Any], detailed: bool):
         """Muestra resultados de escaneo"""
         try:
@@ -1230,7 +1552,7 @@ También puede usar cualquier comando normal:
             # Información básica del sistema
             basic_info = result.get('basic_system', {})
             if basic_info:
-                print("Información del Sistema:")
+                self.display.print_line("Información del Sistema:")
                 self.display.print_metric("Nombre del equipo", basic_info.get('hostname', 'Unknown'))
                 self.display.print_metric("Sistema operativo", basic_info.get('platform', 'Unknown'))
                 self.display.print_metric("Arquitectura", str(basic_info.get('architecture', 'Unknown')))
@@ -1240,7 +1562,7 @@ También puede usar cualquier comando normal:
             # CPU
             cpu_info = result.get('cpu_info', {})
             if cpu_info:
-                print(f"\nInformación de CPU:")
+                self.display.print_line(f"\nInformación de CPU:")
                 self.display.print_metric("Núcleos físicos", str(cpu_info.get('physical_cores', 0)))
                 self.display.print_metric("Núcleos lógicos", str(cpu_info.get('logical_cores', 0)))
                 self.display.print_metric("Uso actual", f"{cpu_info.get('current_usage', 0):.1f}%")
@@ -1253,7 +1575,7 @@ También puede usar cualquier comando normal:
             if memory_info:
                 vm = memory_info.get('virtual_memory', {})
                 if vm:
-                    print(f"\nInformación de Memoria:")
+                    self.display.print_line(f"\nInformación de Memoria:")
                     self.display.print_metric("Total", vm.get('total_formatted', 'Unknown'))
                     self.display.print_metric("Disponible", vm.get('available_formatted', 'Unknown'))
                     self.display.print_metric("Uso", f"{vm.get('percent', 0):.1f}%")
@@ -1261,7 +1583,7 @@ También puede usar cualquier comando normal:
             # Discos
             disk_info = result.get('disk_info', {})
             if disk_info:
-                print(f"\nInformación de Discos:")
+                self.display.print_line(f"\nInformación de Discos:")
                 self.display.print_metric("Espacio total", disk_info.get('total_disk_space_formatted', 'Unknown'))
                 self.display.print_metric("Espacio usado", disk_info.get('total_used_space_formatted', 'Unknown'))
                 self.display.print_metric("Espacio libre", disk_info.get('total_free_space_formatted', 'Unknown'))
@@ -1271,48 +1593,50 @@ También puede usar cualquier comando normal:
             if detailed:
                 hardware_info = result.get('hardware_summary', {})
                 if hardware_info:
-                    print(f"\nResumen de Hardware:")
+                    self.display.print_line(f"\nResumen de Hardware:")
                     self.display.print_metric("Procesador", hardware_info.get('processor_name', 'Unknown'))
+                    motherboard = hardware_info.get('motherboard') or {}
                     self.display.print_metric("Placa madre", 
-                                            f"{hardware_info.get('motherboard', {}).get('manufacturer', 'Unknown')} "
-                                            f"{hardware_info.get('motherboard', {}).get('product', '')}")
+                                            f"{motherboard.get('manufacturer', 'Unknown')} "
+                                            f"{motherboard.get('product', '')}")
                     self.display.print_metric("RAM total", hardware_info.get('total_ram_formatted', 'Unknown'))
                     
                     # Tarjetas gráficas
                     graphics = hardware_info.get('graphics_cards', [])
                     if graphics:
-                        print(f"\n  Tarjetas Gráficas:")
+                        self.display.print_line(f"\n  Tarjetas Gráficas:")
                         for i, gpu in enumerate(graphics[:3]):  # Máximo 3
                             self.display.print_metric(f"    GPU {i+1}", gpu.get('name', 'Unknown'))
             
             # Estado de salud del sistema
             health = result.get('system_health', {})
             if health:
-                print(f"\nEstado de Salud del Sistema:")
+                self.display.print_line(f"\nEstado de Salud del Sistema:")
                 score = health.get('overall_score', 0)
                 status = health.get('overall_status', 'Unknown')
                 
-                color = "good" if score >= 80 else "warning" if score >= 60 else "critical"
+                color = _level(score, _HEALTH_THRESHOLDS, _HEALTH_LEVELS)
                 self.display.print_metric("Puntuación", f"{score}/100", color)
                 self.display.print_metric("Estado", status, color)
                 
                 # Issues críticos
                 critical_issues = health.get('critical_issues', [])
                 if critical_issues:
-                    print(f"\n  Problemas Críticos:")
+                    self.display.print_line(f"\n  Problemas Críticos:")
                     for issue in critical_issues:
                         self.display.print_error(f"    • {issue}")
                 
                 # Advertencias
                 warnings = health.get('warnings', [])
                 if warnings:
-                    print(f"\n  Advertencias:")
+                    self.display.print_line(f"\n  Advertencias:")
                     for warning in warnings:
                         self.display.print_warning(f"    • {warning}")
                         
         except Exception as e:
             self.display.print_error(f"Error mostrando resultados de escaneo: {str(e)}")
     
+    @_buffered_output
     def _display_temperature_results(self, result: Dict[str, Any]):
         """Muestra resultados de monitoreo de temperatura"""
         try:
@@ -1332,7 +1656,7 @@ También puede usar cualquier comando normal:
             # Fuentes de temperatura detectadas
             sources = result.get('temperature_sources', [])
             if sources:
-                print(f"\nFuentes de Temperatura Detectadas ({len(sources)}):")
+                self.display.print_line(f"\nFuentes de Temperatura Detectadas ({len(sources)}):")
                 for source in sources:
                     name = source.get('sensor_name', 'Unknown')
                     count = source.get('sensor_count', 0)
@@ -1343,13 +1667,13 @@ También puede usar cualquier comando normal:
             if stats:
                 temp_sources = stats.get('temperature_sources', {})
                 if temp_sources:
-                    print(f"\nEstadísticas por Fuente:")
+                    self.display.print_line(f"\nEstadísticas por Fuente:")
                     for source, source_stats in temp_sources.items():
                         avg_temp = source_stats.get('average', 0)
                         max_temp = source_stats.get('max', 0)
                         min_temp = source_stats.get('min', 0)
                         
-                        print(f"\n  {source}:")
+                        self.display.print_line(f"\n  {source}:")
                         self.display.print_metric("    Promedio", f"{avg_temp:.1f}°C")
                         self.display.print_metric("    Máxima", f"{max_temp:.1f}°C")
                         self.display.print_metric("    Mínima", f"{min_temp:.1f}°C")
@@ -1357,7 +1681,7 @@ También puede usar cualquier comando normal:
             # Alertas de temperatura
             alerts = result.get('alerts', [])
             if alerts:
-                print(f"\nAlertas de Temperatura ({len(alerts)}):")
+                self.display.print_line(f"\nAlertas de Temperatura ({len(alerts)}):")
                 for alert in alerts:
                     level = alert.get('level', 'INFO')
                     message = alert.get('message', 'Sin mensaje')
@@ -1372,6 +1696,7 @@ También puede usar cualquier comando normal:
         except Exception as e:
             self.display.print_error(f"Error mostrando resultados de temperatura: {str(e)}")
     
+    @_buffered_output
     def _display_cpu_results(self, result: Dict[str, Any], show_cores: bool):
         """Muestra resultados de monitoreo de CPU"""
         try:
@@ -1380,7 +1705,7 @@ También puede usar cualquier comando normal:
             # Información del CPU
             cpu_info = result.get('cpu_info', {})
             if cpu_info:
-                print("Información del CPU:")
+                self.display.print_line("Información del CPU:")
                 self.display.print_metric("Núcleos físicos", str(cpu_info.get('physical_cores', 0)))
                 self.display.print_metric("Núcleos lógicos", str(cpu_info.get('logical_cores', 0)))
                 
@@ -1392,12 +1717,12 @@ También puede usar cualquier comando normal:
             if stats:
                 cpu_usage = stats.get('cpu_usage', {})
                 if cpu_usage:
-                    print(f"\nEstadísticas de Uso:")
+                    self.display.print_line(f"\nEstadísticas de Uso:")
                     avg_usage = cpu_usage.get('average', 0)
                     max_usage = cpu_usage.get('max', 0)
                     min_usage = cpu_usage.get('min', 0)
                     
-                    color = "good" if avg_usage < 70 else "warning" if avg_usage < 90 else "critical"
+                    color = _level(avg_usage, _CPU_THRESHOLDS)
                     
                     self.display.print_metric("Uso promedio", f"{avg_usage:.1f}%", color)
                     self.display.print_metric("Uso máximo", f"{max_usage:.1f}%")
@@ -1407,32 +1732,33 @@ También puede usar cualquier comando normal:
                 if show_cores:
                     core_stats = stats.get('core_statistics', {})
                     if core_stats:
-                        print(f"\nUso por Núcleo:")
+                        self.display.print_line(f"\nUso por Núcleo:")
                         for core, core_data in core_stats.items():
                             avg = core_data.get('average', 0)
-                            color = "good" if avg < 70 else "warning" if avg < 90 else "critical"
+                            color = _level(avg, _CPU_THRESHOLDS)
                             self.display.print_metric(f"  {core}", f"{avg:.1f}%", color)
             
             # Top procesos por CPU
             top_processes = result.get('top_processes', [])
             if top_processes:
-                print(f"\nTop Procesos por CPU:")
+                self.display.print_line(f"\nTop Procesos por CPU:")
                 headers = ['Proceso', 'PID', 'CPU %', 'Usuario']
-                table_data = []
                 
-                for proc in top_processes[:10]:
-                    table_data.append({
-                        'Proceso': proc.get('name', 'Unknown'),
-                        'PID': str(proc.get('pid', 0)),
-                        'CPU %': f"{proc.get('cpu_percent', 0):.1f}",
-                        'Usuario': proc.get('username', 'Unknown')
-                    })
+                # Columnas directamente (sin un diccionario por fila)
+                procs = top_processes[:10]
+                columns = [
+                    [str(proc.get('name', 'Unknown')) for proc in procs],
+                    [str(proc.get('pid', 0)) for proc in procs],
+                    [f"{proc.get('cpu_percent', 0):.1f}" for proc in procs],
+                    [str(proc.get('username', 'Unknown')) for proc in procs]
+                ]
                 
-                print(TableFormatter.format_table(table_data, headers))
+                self.display.print_line(TableFormatter.format_columns(columns, headers))
                 
         except Exception as e:
             self.display.print_error(f"Error mostrando resultados de CPU: {str(e)}")
     
+    @_buffered_output
     def _display_memory_results(self, result: Dict[str, Any], show_processes: bool):
         """Muestra resultados de monitoreo de memoria"""
         try:
@@ -1451,19 +1777,15 @@ También puede usar cualquier comando normal:
                         self.display.print_metric("Módulos de memoria", str(len(modules)))
             
             # Estadísticas del monitoreo
-            stats = result.get('statistics', {})
-            if stats:
-                vm_stats = stats.get('virtual_memory', {})
-                if vm_stats:
-                    usage_stats = vm_stats.get('usage_percent', {})
-                    if usage_stats:
-                        print(f"\nEstadísticas de Uso de Memoria:")
-                        avg_usage = usage_stats.get('average', 0)
-                        max_usage = usage_stats.get('max', 0)
-                        min_usage = usage_stats.get('min', 0)
-                        
-                        color = "good" if avg_usage < 80 else "warning" if avg_usage < 95 else "critical"
-                        
-                        self.display.print_metric("Uso promedio", f"{avg_usage:.1f}%", color)
-                        self.display.print_metric("Uso máximo", f"{max_usage:.1f}%")
-                        self.display.print_
\ No newline at end of file
+            usage_stats = _get_path(result, _MEMORY_USAGE_PATH, {})
+            if usage_stats:
+                self.display.print_line(f"\nEstadísticas de Uso de Memoria:")
+                avg_usage = usage_stats.get('average', 0)
+                max_usage = usage_stats.get('max', 0)
+                min_usage = usage_stats.get('min', 0)
+                
+                color = _level(avg_usage, _MEMORY_THRESHOLDS)
+                
+                self.display.print_metric("Uso promedio", f"{avg_usage:.1f}%", color)
+                self.display.print_metric("Uso máximo", f"{max_usage:.1f}%")
+                self.display.print_
\ No newline at end of file
@@ -8,59 +8,30 @@ Descripción: Configuración global, constantes e imports del sistema
 # Imports estándar de Python
 import sys
 import os
+import atexit
 import logging
 import threading
 import time
 import datetime
 import json
-import tempfile
-import shutil
-import subprocess
 import platform
 import socket
-import uuid
-import traceback
-import queue
 import functools
+import importlib.util
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Callable, Tuple
 from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
 from contextlib import contextmanager
 
-# Imports de terceros
 try:
-    import tkinter as tk
-    from tkinter import ttk, messagebox, filedialog, scrolledtext
-    import matplotlib.pyplot as plt
-    import matplotlib.dates as mdates
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    from matplotlib.figure import Figure
-    import pandas as pd
-    import openpyxl
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-    from openpyxl.chart import LineChart, Reference
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib import colors
-    from reportlab.lib.units import inch
-    import psutil
-    import wmi
-    import win32api
-    import win32con
-    import win32security
-    import win32service
-    import win32serviceutil
-    import win32evtlog
-    import win32gui
-    import win32process
-    import PIL
-    from PIL import Image, ImageTk, ImageGrab
-except ImportError as e:
-    print(f"Error importando dependencias: {e}")
-    print("Ejecute: pip install -r requirements.txt")
-    sys.exit(1)
+    import orjson  # Serialización JSON más rápida (opcional)
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Los módulos de terceros se importan en los módulos que los usan;
+# verify_dependencies comprueba su disponibilidad sin cargarlos
 
 # Configuración global del sistema
 class SystemConfig:
@@ -82,7 +53,8 @@ class SystemConfig:
     CONFIG_DIR = BASE_DIR / "config"
     
     # Configuración de archivos
-    LOG_FILE = LOGS_DIR / f"mantenimiento_pc_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log" # Nombre de log actualizado y timestamp más preciso
+    # El archivo de log se nombra al primer uso (ver get_log_file), no al importar
+    _log_file: Optional[Path] = None
     CONFIG_FILE = CONFIG_DIR / "settings.json"
     STATE_FILE = CONFIG_DIR / "app_state.json"
     
@@ -92,6 +64,7 @@ class SystemConfig:
     LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
     MAX_LOG_SIZE = 50 * 1024 * 1024  # 50MB
     LOG_BACKUP_COUNT = 5
+    LOG_BUFFER_RECORDS = 256  # Registros acumulados antes de escribir el log
     
     # Configuración de timeouts (en segundos)
     WMI_TIMEOUT = 30
@@ -154,6 +127,27 @@ class SystemConfig:
     CPU_THRESHOLD = 90     # Porcentaje
     DISK_THRESHOLD = 90    # Porcentaje
     
+    @classmethod
+    def get_log_file(cls) -> Path:
+        """Ruta del archivo de log de esta ejecución (fijada en la primera llamada)"""
+        if cls._log_file is None:
+            cls._log_file = cls.LOGS_DIR / f"mantenimiento_pc_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        return cls._log_file
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def executor(cls) -> ThreadPoolExecutor:
+        """
+        Pool de hilos compartido por todo el proceso
+        
+        Se crea en la primera llamada (después de ajustar MAX_WORKERS) y se
+        cierra al salir, para no crear y destruir hilos en cada grupo de tareas.
+        """
+        executor = ThreadPoolExecutor(max_workers=cls.MAX_WORKERS,
+                                      thread_name_prefix='MantPC')
+        atexit.register(executor.shutdown, wait=False)
+        return executor
+    
     @classmethod
     def ensure_directories(cls):
         """Asegura que todos los directorios necesarios existan"""
@@ -176,6 +170,9 @@ class SystemConfig:
         """Carga la configuración desde archivo"""
         try:
             if cls.CONFIG_FILE.exists():
+                if ORJSON_AVAILABLE:
+                    with open(cls.CONFIG_FILE, 'rb') as f:
+                        return orjson.loads(f.read())
                 with open(cls.CONFIG_FILE, 'r', encoding='utf-8') as f:
                     return json.load(f)
         except Exception as e:
@@ -187,6 +184,18 @@ class SystemConfig:
         """Guarda la configuración en archivo"""
         try:
             cls.ensure_directories()
+            if ORJSON_AVAILABLE:
+                try:
+                    payload = orjson.dumps(
+                        config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                except TypeError:
+                    # Tipos que orjson no admite: se recurre a json
+                    payload = None
+                if payload is not None:
+                    with open(cls.CONFIG_FILE, 'wb') as f:
+                        f.write(payload)
+                    return
             with open(cls.CONFIG_FILE, 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=4, ensure_ascii=False)
         except Exception as e:
@@ -262,12 +271,13 @@ def setup_logging():
             root_logger.removeHandler(handler)
         
         # Handler para archivo con rotación
-        from logging.handlers import RotatingFileHandler
+        from logging.handlers import RotatingFileHandler, MemoryHandler
         file_handler = RotatingFileHandler(
-            SystemConfig.LOG_FILE,
+            SystemConfig.get_log_file(),
             maxBytes=SystemConfig.MAX_LOG_SIZE,
             backupCount=SystemConfig.LOG_BACKUP_COUNT,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True
         )
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
@@ -275,7 +285,16 @@ def setup_logging():
             datefmt=SystemConfig.LOG_DATE_FORMAT
         )
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        
+        # Escritura en bloque: los registros se acumulan y se vuelcan al
+        # llenarse el buffer, con un ERROR o al cerrar (logging.shutdown)
+        buffered_handler = MemoryHandler(
+            SystemConfig.LOG_BUFFER_RECORDS,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        buffered_handler.setLevel(logging.DEBUG)
+        root_logger.addHandler(buffered_handler)
         
         # Handler para consola
         console_handler = logging.StreamHandler(sys.stdout)
@@ -341,33 +360,35 @@ def cleanup_temp_files():
     """Limpia archivos temporales antiguos"""
     logger = logging.getLogger(__name__) # Usar __name__ y obtener logger localmente
     try:
+        # os.scandir trae tipo y fecha de cada entrada en el propio listado
+        # (FindFirstFileW), sin un stat adicional por archivo
+        current_time = time.time()
+        
         temp_dir = SystemConfig.TEMP_DIR
         if temp_dir.exists():
-            current_time = time.time()
-            for file_path in temp_dir.iterdir():
-                if file_path.is_file():
+            cutoff = current_time - 24 * 3600 # 1 día
+            with os.scandir(temp_dir) as entries:
+                for entry in entries:
                     try:
-                        file_age = current_time - file_path.stat().st_mtime
                         # Eliminar archivos más antiguos que 24 horas
-                        if file_age > 24 * 3600: # 1 día
-                            logger.debug(f"Eliminando archivo temporal antiguo: {file_path}")
-                            file_path.unlink()
-                    except Exception as ex_file:
-                        logger.warning(f"No se pudo procesar/eliminar archivo temporal {file_path}: {ex_file}")
+                        if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                            logger.debug(f"Eliminando archivo temporal antiguo: {entry.path}")
+                            os.unlink(entry.path)
+                    except OSError as ex_file:
+                        logger.warning(f"No se pudo procesar/eliminar archivo temporal {entry.path}: {ex_file}")
                         
         # Limpiar screenshots antiguos (más de 7 días)
         screenshots_dir = SystemConfig.SCREENSHOTS_DIR
         if screenshots_dir.exists():
-            current_time = time.time()
-            for file_path in screenshots_dir.iterdir():
-                if file_path.is_file():
+            cutoff = current_time - 7 * 24 * 3600 # 7 días
+            with os.scandir(screenshots_dir) as entries:
+                for entry in entries:
                     try:
-                        file_age = current_time - file_path.stat().st_mtime
-                        if file_age > 7 * 24 * 3600: # 7 días
-                            logger.debug(f"Eliminando screenshot antiguo: {file_path}")
-                            file_path.unlink()
-                    except Exception as ex_screenshot:
-                        logger.warning(f"No se pudo procesar/eliminar screenshot {file_path}: {ex_screenshot}")
+                        if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                            logger.debug(f"Eliminando screenshot antiguo: {entry.path}")
+                            os.unlink(entry.path)
+                    except OSError as ex_screenshot:
+                        logger.warning(f"No se pudo procesar/eliminar screenshot {entry.path}: {ex_screenshot}")
                         
     except Exception as e:
         logger.exception("Error general durante la limpieza de archivos temporales.") # Usar logger.exception
@@ -380,12 +401,11 @@ def verify_dependencies():
         'psutil', 'wmi', 'win32api', 'PIL'
     ]
     
-    missing_modules = []
-    for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
-            missing_modules.append(module)
+    # find_spec localiza el módulo sin ejecutarlo
+    missing_modules = [
+        module for module in required_modules
+        if importlib.util.find_spec(module) is None
+    ]
     
     if missing_modules:
         print(f"Módulos faltantes: {', '.join(missing_modules)}")
@@ -394,6 +414,32 @@ def verify_dependencies():
     
     return True
 
+# Datos de plataforma sin subprocesos
+@functools.lru_cache(maxsize=None)
+def _cpu_name() -> str:
+    """Nombre del procesador leído del registro (en caché)"""
+    if sys.platform == 'win32':
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE,
+                                r"HARDWARE\DESCRIPTION\System\CentralProcessor\0") as key:
+                return winreg.QueryValueEx(key, "ProcessorNameString")[0].strip()
+        except OSError:
+            pass
+    return platform.processor()
+
+@functools.lru_cache(maxsize=None)
+def _platform_name() -> str:
+    """Descripción de la plataforma sin lanzar subprocesos (en caché)"""
+    if sys.platform == 'win32':
+        version = sys.getwindowsversion()
+        return f"Windows-{version.major}.{version.minor}.{version.build}"
+    return f"{sys.platform}-{os.uname().release}" if hasattr(os, 'uname') else sys.platform
+
+def _architecture() -> str:
+    """Arquitectura del intérprete ('64bit' o '32bit')"""
+    return '64bit' if sys.maxsize > 2**32 else '32bit'
+
 # Información del sistema al inicio
 def log_system_info():
     """Registra información básica del sistema"""
@@ -403,9 +449,9 @@ def log_system_info():
         logger.info(f"Autor: {SystemConfig.APP_AUTHOR}")
         logger.info(f"Fecha: {SystemConfig.APP_DATE}")
         logger.info(f"Python: {sys.version}")
-        logger.info(f"Plataforma: {platform.platform()}")
-        logger.info(f"Procesador: {platform.processor()}")
-        logger.info(f"Arquitectura: {platform.architecture()[0]}")
+        logger.info(f"Plataforma: {_platform_name()}")
+        logger.info(f"Procesador: {_cpu_name()}")
+        logger.info(f"Arquitectura: {_architecture()}")
         logger.info(f"Hostname: {socket.gethostname()}")
         logger.info(f"Usuario: {os.getenv('USERNAME', 'Desconocido')}")
         logger.info("=" * 50)
@@ -14,14 +14,16 @@ import json
 import subprocess
 import tempfile
 import hashlib
-import base64
+import functools
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple, Mapping
 import logging
 import platform
 import urllib.request
 import urllib.parse
+from concurrent.futures import wait
 
 # Importar módulos del sistema
 from config_and_imports import SystemConfig, SystemConstants
@@ -31,6 +33,62 @@ from main_runner import SystemMonitorRunner
 # Logger para este módulo
 logger = logging.getLogger(__name__)
 
+def _fast_copy(src: Path, dst: Path):
+    """
+    Copia un archivo delegando en el kernel, conservando metadatos como copy2
+    
+    En Windows usa CopyFileExW (copia por bloques en el kernel, con fechas);
+    en el resto, os.sendfile sin pasar por espacio de usuario. Si la vía
+    nativa falla, recurre a shutil.copy2.
+    """
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            cancel = ctypes.c_int(0)
+            if not ctypes.windll.kernel32.CopyFileExW(
+                    str(src), str(dst), None, None, ctypes.byref(cancel), 0):
+                raise ctypes.WinError()
+            return
+        
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            remaining = os.fstat(in_fd).st_size
+            offset = 0
+            while remaining > 0:
+                sent = os.sendfile(out_fd, in_fd, offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        shutil.copystat(src, dst)
+    except (OSError, AttributeError):
+        shutil.copy2(src, dst)
+
+# Nombre de plataforma según sys.platform, sin consultar platform.system()
+_PLATFORM_NAMES = {'win32': 'Windows', 'linux': 'Linux', 'darwin': 'Darwin'}
+
+@functools.lru_cache(maxsize=None)
+def _package_metadata(version: str, author: str, build_date: str,
+                      user: str) -> Mapping[str, Any]:
+    """Metadatos del paquete, calculados una vez por combinación de argumentos"""
+    return MappingProxyType({
+        "name": "SystemMonitor",
+        "version": version,
+        "author": author,
+        "build_date": build_date,
+        "current_user": user,
+        "description": "Sistema de Monitoreo de PC completo",
+        "python_version": f"{sys.version_info.major}.{sys.version_info.minor}",
+        "platform": _PLATFORM_NAMES.get(sys.platform) or platform.system(),
+        "architecture": '64bit' if sys.maxsize > 2**32 else '32bit',
+        "dependencies": (
+            "psutil>=5.8.0",
+            "pywin32>=227",
+            "Pillow>=8.0.0",
+            "tkinter"
+        )
+    })
+
 class DeploymentPackager:
     """Empaquetador para distribución del sistema"""
     
@@ -74,24 +132,10 @@ class DeploymentPackager:
             "requirements.txt"
         ]
         
-        # Metadatos del paquete
-        self.package_metadata = {
-            "name": "SystemMonitor",
-            "version": self.version,
-            "author": self.author,
-            "build_date": self.build_date,
-            "current_user": self.current_user,
-            "description": "Sistema de Monitoreo de PC completo",
-            "python_version": f"{sys.version_info.major}.{sys.version_info.minor}",
-            "platform": platform.system(),
-            "architecture": platform.architecture()[0],
-            "dependencies": [
-                "psutil>=5.8.0",
-                "pywin32>=227",
-                "Pillow>=8.0.0",
-                "tkinter"
-            ]
-        }
+        # Metadatos del paquete (inmutables y compartidos entre instancias)
+        self.package_metadata = _package_metadata(
+            self.version, self.author, self.build_date, self.current_user
+        )
     
     def create_distribution_package(self, package_type: str = "zip", 
                                   include_installer: bool = True) -> str:
@@ -160,18 +204,11 @@ class DeploymentPackager:
             self.dist_dir.mkdir(parents=True, exist_ok=True)
             self.temp_dir.mkdir(parents=True, exist_ok=True)
             
-            # Estructura del paquete
-            package_structure = [
-                "SystemMonitor",
-                "SystemMonitor/modules",
-                "SystemMonitor/docs",
-                "SystemMonitor/scripts",
-                "SystemMonitor/config",
-                "SystemMonitor/templates"
-            ]
-            
-            for dir_path in package_structure:
-                (self.build_dir / dir_path).mkdir(parents=True, exist_ok=True)
+            # Estructura del paquete: la raíz una vez y luego solo las hojas
+            package_root = self.build_dir / "SystemMonitor"
+            package_root.mkdir(parents=True, exist_ok=True)
+            for subdir in ("modules", "docs", "scripts", "config", "templates"):
+                (package_root / subdir).mkdir(exist_ok=True)
             
             logger.info("Entorno de construcción preparado")
             
@@ -185,16 +222,30 @@ class DeploymentPackager:
             dest_modules = self.build_dir / "SystemMonitor" / "modules"
             
             # Copiar módulos principales
+            copies = []
             for module_file in self.module_files:
                 src_path = self.source_dir / module_file
                 if src_path.exists():
                     # Usar el nombre de archivo directamente ya que han sido renombrados
-                    dest_path = dest_modules / module_file
-                    shutil.copy2(src_path, dest_path)
-                    logger.debug(f"Copiado: {module_file} -> {module_file}")
+                    copies.append((module_file, src_path, dest_modules / module_file))
                 else:
                     logger.warning(f"Archivo no encontrado: {module_file}")
             
+            # Copias simultáneas en el pool compartido (en SSD domina la
+            # latencia por archivo); se esperan todas antes de seguir
+            executor = SystemConfig.executor()
+            futures = [(module_file, executor.submit(_fast_copy, src_path, dest_path))
+                       for module_file, src_path, dest_path in copies]
+            try:
+                for module_file, future in futures:
+                    future.result()
+                    logger.debug(f"Copiado: {module_file} -> {module_file}")
+            finally:
+                # Ante un error, no dejar copias pendientes en segundo plano
+                for _, future in futures:
+                    future.cancel()
+                wait([future for _, future in futures])
+            
             # Crear __init__.py para módulos
             init_content = f'''"""
 Mantenimiento de PC v{self.version}
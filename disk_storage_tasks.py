@@ -96,29 +96,35 @@ class DiskAnalysisTask(BaseTask):
             }
             
             # Obtener información de discos físicos
-            self.update_progress(10, "Analizando discos físicos...")
+            if not self.checkpoint(10, "Analizando discos físicos..."):
+                return disk_data
             disk_data['physical_disks'] = self._analyze_physical_disks()
             
             # Obtener información de unidades lógicas
-            self.update_progress(30, "Analizando unidades lógicas...")
+            if not self.checkpoint(30, "Analizando unidades lógicas..."):
+                return disk_data
             disk_data['logical_drives'] = self._analyze_logical_drives()
             
             # Resumen de uso de disco
-            self.update_progress(50, "Calculando resumen de uso...")
+            if not self.checkpoint(50, "Calculando resumen de uso..."):
+                return disk_data
             disk_data['disk_usage_summary'] = self._calculate_usage_summary(disk_data['logical_drives'])
             
             # Métricas de rendimiento
             if self.include_performance:
-                self.update_progress(70, "Analizando rendimiento...")
+                if not self.checkpoint(70, "Analizando rendimiento..."):
+                    return disk_data
                 disk_data['performance_metrics'] = self._analyze_disk_performance()
             
             # Estado de salud
             if self.include_health:
-                self.update_progress(85, "Verificando salud de discos...")
+                if not self.checkpoint(85, "Verificando salud de discos..."):
+                    return disk_data
                 disk_data['health_status'] = self._check_disk_health(disk_data['physical_disks'])
             
             # Recomendaciones
-            self.update_progress(95, "Generando recomendaciones...")
+            if not self.checkpoint(95, "Generando recomendaciones..."):
+                return disk_data
             disk_data['recommendations'] = self._generate_disk_recommendations(disk_data)
             
             # Información final
@@ -9,14 +9,21 @@ import threading
 import time
 import json
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, date, time as dt_time, timedelta
 from typing import Dict, List, Any, Optional, Callable
 from pathlib import Path
 import asyncio
 import queue
-from dataclasses import dataclass, field
+from concurrent.futures import Future
+from dataclasses import dataclass, field, asdict, is_dataclass
 from enum import Enum
 
+try:
+    import orjson  # Serialización JSON más rápida (opcional)
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Importar todos los módulos del sistema
 from config_and_imports import SystemConfig, SystemConstants
 from utilities import (
@@ -45,6 +52,49 @@ from basic_tasks import SystemInfoTask, QuickSystemCheckTask
 # Logger para este módulo
 logger = logging.getLogger(__name__)
 
+def _json_default(obj: Any) -> Any:
+    """
+    Conversión de tipos no serializables, equivalente a la que aplica orjson
+    (fechas en ISO 8601, Enum por su valor) para que el formato no dependa de él
+    """
+    if isinstance(obj, (datetime, date, dt_time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+
+def _write_json(filepath: Path, data: Any):
+    """
+    Escribe datos en un archivo JSON con sangría, usando orjson si está disponible
+    
+    Args:
+        filepath: Ruta del archivo destino
+        data: Datos a serializar (lo no serializable pasa por _json_default)
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            payload = orjson.dumps(
+                data,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        except TypeError:
+            # p. ej. enteros fuera de 64 bits: se recurre a json
+            payload = None
+        
+        if payload is not None:
+            with open(filepath, 'wb') as f:
+                f.write(payload)
+            return
+    
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
+
 class MonitoringMode(Enum):
     """Modos de monitoreo del sistema"""
     BASIC = "basic"
@@ -113,6 +163,10 @@ class SystemMonitorInterface:
         self.progress_callback: Optional[Callable[[str, float], None]] = None
         self.result_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
         
+        # Suscriptores a cambios de sesión (finalización de tareas y de sesión)
+        self._status_subscribers: List[Callable[[Dict[str, Any]], None]] = []
+        self._subscribers_lock = threading.Lock()
+        
         # Configuración
         self.auto_save_results = True
         self.results_directory = SystemConfig.REPORTS_DIR
@@ -481,6 +535,16 @@ class SystemMonitorInterface:
             logger.error(f"Error obteniendo resultado de tarea {task_id}: {e}")
             return None
     
+    def get_task_future(self, task_id: str) -> Optional[Future]:
+        """
+        Obtiene un Future que se resuelve con el resultado de la tarea
+        
+        Permite esperar la finalización sin sondear get_task_result;
+        el valor del Future es el TaskResult (usar to_dict() si se necesita
+        el diccionario).
+        """
+        return self.task_scheduler.get_task_future(task_id)
+    
     def take_screenshot(self, include_all_monitors: bool = True) -> Optional[Dict[str, Any]]:
         """Toma una captura de pantalla"""
         try:
@@ -587,8 +651,7 @@ class SystemMonitorInterface:
             
             if format == 'json':
                 filepath = self.results_directory / f"{filename}.json"
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(report_data, f, indent=2, ensure_ascii=False, default=str)
+                _write_json(filepath, report_data)
             
             elif format == 'html':
                 filepath = self.results_directory / f"{filename}.html"
@@ -621,8 +684,47 @@ class SystemMonitorInterface:
         self.result_callback = result_callback
         logger.info("Callbacks configurados")
     
+    def subscribe_status(self, callback: Callable[[Dict[str, Any]], None]):
+        """
+        Registra un callback para cambios de la sesión de monitoreo
+        
+        Se invoca al terminar cada tarea y al finalizar la sesión, con un
+        resumen ligero: active_monitoring, tasks_completed y tasks_failed.
+        Evita sondear get_system_status para seguir el progreso.
+        """
+        with self._subscribers_lock:
+            self._status_subscribers.append(callback)
+    
+    def unsubscribe_status(self, callback: Callable[[Dict[str, Any]], None]):
+        """Elimina un callback registrado con subscribe_status"""
+        with self._subscribers_lock:
+            try:
+                self._status_subscribers.remove(callback)
+            except ValueError:
+                pass
+    
     # Métodos privados
     
+    def _notify_status_subscribers(self):
+        """Envía el resumen de la sesión actual a los suscriptores"""
+        with self._subscribers_lock:
+            subscribers = list(self._status_subscribers)
+        if not subscribers:
+            return
+        
+        session = self.current_session
+        summary = {
+            'active_monitoring': session is not None,
+            'tasks_completed': session.tasks_completed if session else 0,
+            'tasks_failed': session.tasks_failed if session else 0
+        }
+        
+        for callback in subscribers:
+            try:
+                callback(summary)
+            except Exception as e:
+                logger.error(f"Error en suscriptor de estado: {e}")
+    
     def _schedule_tasks_for_mode(self, mode: MonitoringMode, 
                                custom_config: Dict[str, Any] = None) -> List[str]:
         """Programa tareas según el modo de monitoreo"""
@@ -752,6 +854,7 @@ class SystemMonitorInterface:
                 self._save_task_result(task_identifier, result)
             
             logger.info(f"Tarea {task_identifier} completada: {result.status.value}")
+            self._notify_status_subscribers()
             
         except Exception as e:
             logger.error(f"Error manejando finalización de tarea: {e}")
@@ -906,6 +1009,7 @@ class SystemMonitorInterface:
             
             logger.info(f"Sesión finalizada: {self.current_session.session_id}")
             self.current_session = None
+            self._notify_status_subscribers()
             
         except Exception as e:
             logger.error(f"Error finalizando sesión: {e}")
@@ -934,8 +1038,7 @@ class SystemMonitorInterface:
             filename = f"task_result_{task_id}_{timestamp}.json"
             filepath = self.results_directory / filename
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(result.to_dict(), f, indent=2, ensure_ascii=False, default=str)
+            _write_json(filepath, result.to_dict())
                 
         except Exception as e:
             logger.error(f"Error guardando resultado de tarea: {e}")
@@ -965,8 +1068,7 @@ class SystemMonitorInterface:
                 }
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
+            _write_json(filepath, summary)
                 
         except Exception as e:
             logger.error(f"Error guardando resumen de sesión: {e}")
@@ -993,8 +1095,7 @@ class SystemMonitorInterface:
                 'scheduler_status': self.task_scheduler.get_status()
             }
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(state, f, indent=2, ensure_ascii=False, default=str)
+            _write_json(filepath, state)
                 
         except Exception as e:
             logger.error(f"Error guardando estado del sistema: {e}")
@@ -15,8 +15,6 @@ import logging
 
 try:
     from PIL import Image, ImageDraw, ImageFont, ImageGrab
-    import tkinter as tk
-    from tkinter import messagebox
     import win32gui
     import win32con
     import win32api
@@ -98,34 +98,41 @@ class AntivirusStatusTask(BaseTask):
             }
             
             # Detectar productos antivirus
-            self.update_progress(20, "Detectando productos antivirus...")
+            if not self.checkpoint(20, "Detectando productos antivirus..."):
+                return antivirus_data
             antivirus_data['antivirus_products'] = self._detect_antivirus_products()
             
             # Verificar Windows Defender específicamente
-            self.update_progress(40, "Verificando Windows Defender...")
+            if not self.checkpoint(40, "Verificando Windows Defender..."):
+                return antivirus_data
             antivirus_data['windows_defender'] = self._check_windows_defender()
             
             # Verificar Security Center
-            self.update_progress(60, "Verificando Security Center...")
+            if not self.checkpoint(60, "Verificando Security Center..."):
+                return antivirus_data
             antivirus_data['security_center_status'] = self._check_security_center()
             
             # Verificar protección en tiempo real
             if self.check_real_time_protection:
-                self.update_progress(75, "Verificando protección en tiempo real...")
+                if not self.checkpoint(75, "Verificando protección en tiempo real..."):
+                    return antivirus_data
                 antivirus_data['real_time_protection'] = self._check_real_time_protection()
             
             # Verificar estado de definiciones
             if self.check_definitions:
-                self.update_progress(85, "Verificando definiciones...")
+                if not self.checkpoint(85, "Verificando definiciones..."):
+                    return antivirus_data
                 antivirus_data['definitions_status'] = self._check_definitions_status()
             
             # Verificar historial de escaneos
             if self.check_scan_history:
-                self.update_progress(90, "Verificando historial de escaneos...")
+                if not self.checkpoint(90, "Verificando historial de escaneos..."):
+                    return antivirus_data
                 antivirus_data['scan_history'] = self._check_scan_history()
             
             # Evaluar nivel de seguridad general
-            self.update_progress(95, "Evaluando seguridad general...")
+            if not self.checkpoint(95, "Evaluando seguridad general..."):
+                return antivirus_data
             antivirus_data['overall_security_level'] = self._evaluate_security_level(antivirus_data)
             
             # Generar recomendaciones
@@ -854,27 +861,32 @@ class WindowsUpdateTask(BaseTask):
             
             # Verificar configuración de actualizaciones automáticas
             if self.check_auto_update_settings:
-                self.update_progress(20, "Verificando configuración de actualizaciones...")
+                if not self.checkpoint(20, "Verificando configuración de actualizaciones..."):
+                    return update_data
                 update_data['auto_update_settings'] = self._check_auto_update_settings()
             
             # Verificar actualizaciones pendientes
             if self.check_pending_updates:
-                self.update_progress(50, "Verificando actualizaciones pendientes...")
+                if not self.checkpoint(50, "Verificando actualizaciones pendientes..."):
+                    return update_data
                 update_data['pending_updates'] = self._check_pending_updates()
                 update_data['reboot_required'] = self._check_reboot_required()
             
             # Verificar historial de actualizaciones
             if self.check_update_history:
-                self.update_progress(75, "Verificando historial de actualizaciones...")
+                if not self.checkpoint(75, "Verificando historial de actualizaciones..."):
+                    return update_data
                 update_data['update_history'] = self._check_update_history()
             
             # Verificar tiempos de última verificación e instalación
-            self.update_progress(85, "Verificando tiempos de actualización...")
+            if not self.checkpoint(85, "Verificando tiempos de actualización..."):
+                return update_data
             update_data['last_check_time'] = self._get_last_check_time()
             update_data['last_install_time'] = self._get_last_install_time()
             
             # Evaluar estado general
-            self.update_progress(95, "Evaluando estado general...")
+            if not self.checkpoint(95, "Evaluando estado general..."):
+                return update_data
             update_data['overall_update_status'] = self._evaluate_update_status(update_data)
             
             # Generar recomendaciones
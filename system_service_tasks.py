@@ -119,34 +119,41 @@ class StartupProgramsTask(BaseTask):
             
             # Analizar entradas del registro
             if self.check_registry_startup:
-                self.update_progress(20, "Analizando registro de inicio...")
+                if not self.checkpoint(20, "Analizando registro de inicio..."):
+                    return startup_data
                 startup_data['registry_startup'] = self._analyze_registry_startup()
             
             # Analizar carpetas de inicio
             if self.check_startup_folders:
-                self.update_progress(40, "Analizando carpetas de inicio...")
+                if not self.checkpoint(40, "Analizando carpetas de inicio..."):
+                    return startup_data
                 startup_data['folder_startup'] = self._analyze_startup_folders()
             
             # Analizar tareas programadas
             if self.check_scheduled_tasks:
-                self.update_progress(60, "Analizando tareas programadas...")
+                if not self.checkpoint(60, "Analizando tareas programadas..."):
+                    return startup_data
                 startup_data['scheduled_tasks'] = self._analyze_scheduled_tasks()
             
             # Analizar servicios automáticos
             if self.check_services_startup:
-                self.update_progress(75, "Analizando servicios automáticos...")
+                if not self.checkpoint(75, "Analizando servicios automáticos..."):
+                    return startup_data
                 startup_data['auto_services'] = self._analyze_auto_services()
             
             # Generar resumen
-            self.update_progress(85, "Generando resumen...")
+            if not self.checkpoint(85, "Generando resumen..."):
+                return startup_data
             startup_data['startup_summary'] = self._generate_startup_summary(startup_data)
             
             # Analizar impacto en rendimiento
-            self.update_progress(90, "Analizando impacto en rendimiento...")
+            if not self.checkpoint(90, "Analizando impacto en rendimiento..."):
+                return startup_data
             startup_data['performance_impact'] = self._analyze_startup_performance_impact(startup_data)
             
             # Análisis de seguridad
-            self.update_progress(95, "Analizando aspectos de seguridad...")
+            if not self.checkpoint(95, "Analizando aspectos de seguridad..."):
+                return startup_data
             startup_data['security_analysis'] = self._analyze_startup_security(startup_data)
             
             # Generar recomendaciones
@@ -287,6 +287,38 @@ class SecurityUtilities:
             logger.error(f"Error generando hash: {e}")
             return ""
     
+    @staticmethod
+    def hash_file(file_path: Union[str, Path], algorithm: str = 'sha256') -> str:
+        """
+        Genera hash del contenido de un archivo
+        
+        Args:
+            file_path: Ruta del archivo
+            algorithm: Algoritmo de hash
+            
+        Returns:
+            Hash en hexadecimal
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: lectura en C con buffer propio
+                    return hashlib.file_digest(f, algorithm).hexdigest()
+                
+                hasher = hashlib.new(algorithm)
+                buffer = bytearray(1024 * 1024)
+                view = memoryview(buffer)
+                while True:
+                    size = f.readinto(buffer)
+                    if not size:
+                        break
+                    hasher.update(view[:size])
+                return hasher.hexdigest()
+            
+        except Exception as e:
+            logger.error(f"Error generando hash de {file_path}: {e}")
+            return ""
+    
     @staticmethod
     def encode_base64(text: str) -> str:
         """Codifica texto en base64"""